@@ -6,21 +6,14 @@ A streamlined entry point that delegates to the refactored CLI module.
 """
 
 import sys
-import os
+from pathlib import Path
 
-# Add current directory to Python path to ensure imports work
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+if __name__ == '__main__':
+    # Running the script puts its directory on sys.path already; only add
+    # it when launched some other way (e.g. with -I)
+    repo_root = str(Path(__file__).resolve().parent)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
 
-# Import the main function
-try:
     from src.cli import main
-except ImportError as e:
-    print(f"Error importing CLI module: {e}")
-    print(f"Current directory: {current_dir}")
-    print(f"Python path: {sys.path}")
-    sys.exit(1)
-
-if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,16 +1,33 @@
 """Command line interface for the NPI Suppression Rule Engine."""
 
 import argparse
+import os
 import sys
-from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import List, Optional
 
 from .core.config import AppConfig
-from .orchestration.pipeline import ProcessingPipeline
+from .core.constants import DEFAULT_BATCH_SIZE, DEFAULT_FETCH_ARRAYSIZE
 from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+# Option defaults shared by argparse and the fast-path parser
+_ARG_DEFAULTS = MappingProxyType({
+    'rules': None,
+    'csv_universe': None,
+    'teradata_universe': None,
+    'csv_npi_column': 'npi',
+    'batch_size': DEFAULT_BATCH_SIZE,
+    'fetch_size': DEFAULT_FETCH_ARRAYSIZE,
+    'output': './reports',
+    'dry_run': False,
+    'analyze_csv_only': False,
+    'verbose': False,
+})
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure argument parser."""
     parser = argparse.ArgumentParser(
@@ -50,21 +67,27 @@ Examples:
     # CSV options
     parser.add_argument(
         '--csv-npi-column',
-        default='npi',
-        help='Column name containing NPIs in CSV (default: npi)'
+        default=_ARG_DEFAULTS['csv_npi_column'],
+        help=f"Column name containing NPIs in CSV (default: {_ARG_DEFAULTS['csv_npi_column']})"
     )
     
     # Processing options
     parser.add_argument(
         '--batch-size',
         type=int,
-        default=10000,
-        help='Batch size for processing (default: 10000)'
+        default=_ARG_DEFAULTS['batch_size'],
+        help=f"Batch size for processing (default: {_ARG_DEFAULTS['batch_size']})"
+    )
+    parser.add_argument(
+        '--fetch-size',
+        type=int,
+        default=_ARG_DEFAULTS['fetch_size'],
+        help=f"Rows fetched per database round trip for reports (default: {_ARG_DEFAULTS['fetch_size']})"
     )
     parser.add_argument(
         '--output',
-        default='./reports',
-        help='Output directory for reports (default: ./reports)'
+        default=_ARG_DEFAULTS['output'],
+        help=f"Output directory for reports (default: {_ARG_DEFAULTS['output']})"
     )
     
     # Operation modes
@@ -89,22 +112,94 @@ Examples:
     return parser
 
 
+# Long flag -> (attribute, kind) for the fast-path parser
+_FAST_FLAGS = {
+    '--rules': ('rules', str),
+    '--csv-universe': ('csv_universe', str),
+    '--teradata-universe': ('teradata_universe', str),
+    '--csv-npi-column': ('csv_npi_column', str),
+    '--batch-size': ('batch_size', int),
+    '--fetch-size': ('fetch_size', int),
+    '--output': ('output', str),
+    '--dry-run': ('dry_run', bool),
+    '--analyze-csv-only': ('analyze_csv_only', bool),
+    '--verbose': ('verbose', bool),
+}
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common CLI shape without building the argparse parser.
+    
+    Returns None for anything unusual (help, unknown or repeated flags,
+    '--flag=value' syntax, bad values, missing required arguments) so the
+    caller can fall back to argparse for full handling and error messages.
+    """
+    values = dict(_ARG_DEFAULTS)
+    seen = set()
+    i = 0
+    
+    while i < len(argv):
+        spec = _FAST_FLAGS.get(argv[i])
+        if spec is None or argv[i] in seen:
+            return None
+        seen.add(argv[i])
+        attr, kind = spec
+        
+        if kind is bool:
+            values[attr] = True
+            i += 1
+            continue
+        
+        if i + 1 >= len(argv) or argv[i + 1].startswith('-'):
+            return None
+        if kind is int:
+            try:
+                values[attr] = int(argv[i + 1])
+            except ValueError:
+                return None
+        else:
+            values[attr] = argv[i + 1]
+        i += 2
+    
+    # Required --rules and exactly one universe source
+    if values['rules'] is None:
+        return None
+    if (values['csv_universe'] is None) == (values['teradata_universe'] is None):
+        return None
+    
+    return SimpleNamespace(**values)
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command line arguments, using the fast path when possible."""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    args = _fast_parse(argv)
+    if args is None:
+        args = create_parser().parse_args(argv)
+    return args
+
+
 def validate_args(args: argparse.Namespace) -> bool:
     """Validate command line arguments."""
-    # Validate rules file
-    if not Path(args.rules).exists():
-        logger.error(f"Rules configuration file not found: {args.rules}")
+    # Validate rules file; keep the stat result so loading can reuse it
+    try:
+        args.rules_stat = os.stat(args.rules)
+    except OSError as e:
+        logger.error(f"Rules configuration file not accessible: {args.rules} ({e.strerror})")
         return False
     
     # Validate CSV file if specified
     if args.csv_universe:
-        csv_path = Path(args.csv_universe)
-        if not csv_path.exists():
-            logger.error(f"CSV universe file not found: {args.csv_universe}")
+        try:
+            file_size = os.stat(args.csv_universe).st_size
+        except OSError as e:
+            logger.error(f"CSV universe file not accessible: {args.csv_universe} ({e.strerror})")
             return False
         
         # Log file info
-        file_size = csv_path.stat().st_size
         logger.info(
             f"CSV universe file: {args.csv_universe} "
             f"({file_size:,} bytes, {file_size/1024/1024:.1f} MB)"
@@ -115,8 +210,7 @@ def validate_args(args: argparse.Namespace) -> bool:
 
 def main():
     """Main entry point for the application."""
-    parser = create_parser()
-    args = parser.parse_args()
+    args = parse_args()
     
     # Validate arguments
     if not validate_args(args):
@@ -132,6 +226,9 @@ def main():
             analyze_csv_universe(args.csv_universe, args.csv_npi_column)
             return
         
+        # Imported here so CSV-only and help runs skip the database stack
+        from .orchestration.pipeline import ProcessingPipeline
+        
         # Create and run pipeline
         pipeline = ProcessingPipeline(config)
         
@@ -2,16 +2,41 @@
 
 import os
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 import yaml
 from dotenv import load_dotenv
 
+from .constants import DEFAULT_BATCH_SIZE, DEFAULT_FETCH_ARRAYSIZE
 from .exceptions import ConfigurationError
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer the libyaml-backed loader; the pure-Python parser is much slower
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+    logger.warning("libyaml not available, falling back to pure-Python YAML loader")
+
+# .env is parsed at most once per process
+_ENV_LOADED = False
+
+_REQUIRED_ENV_VARS = ('DB_HOST', 'DB_USERNAME', 'DB_PASSWORD')
+
+# Sentinel for single-probe dict lookups
+_MISSING = object()
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; cached on (path, mtime, size) so edits invalidate it."""
+    with open(path, 'r') as f:
+        return yaml.load(f.read(), Loader=SafeLoader)
+
 
 @dataclass
 class DatabaseConfig:
@@ -24,34 +49,43 @@ class DatabaseConfig:
     encryptdata: bool = True
     
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> 'DatabaseConfig':
-        """Create configuration from environment variables."""
-        load_dotenv()
+        """
+        Create configuration from environment variables.
+        
+        The result is cached, so every caller in the process shares one instance.
+        """
+        global _ENV_LOADED
+        if not _ENV_LOADED:
+            load_dotenv()
+            _ENV_LOADED = True
         
-        required_vars = ['DB_HOST', 'DB_USERNAME', 'DB_PASSWORD']
-        missing = [var for var in required_vars if not os.getenv(var)]
+        required = {var: os.getenv(var) for var in _REQUIRED_ENV_VARS}
+        missing = [var for var, value in required.items() if not value]
         
         if missing:
             raise ConfigurationError(f"Missing required environment variables: {', '.join(missing)}")
         
         return cls(
-            host=os.getenv('DB_HOST'),
-            username=os.getenv('DB_USERNAME'),
-            password=os.getenv('DB_PASSWORD'),
+            host=required['DB_HOST'],
+            username=required['DB_USERNAME'],
+            password=required['DB_PASSWORD'],
             port=int(os.getenv('DB_PORT', '1025')),
             logmech=os.getenv('DB_LOGMECH', 'TD2'),
             encryptdata=os.getenv('DB_ENCRYPTDATA', 'true').lower() == 'true'
         )
     
-    def to_connection_params(self) -> Dict[str, Any]:
-        """Convert to teradatasql connection parameters."""
-        return {
+    @cached_property
+    def connection_params(self) -> Mapping[str, Any]:
+        """Read-only teradatasql connection parameters, built once."""
+        return MappingProxyType({
             'host': self.host,
             'user': self.username,
             'password': self.password,
             'logmech': self.logmech,
             'encryptdata': self.encryptdata
-        }
+        })
 
 
 @dataclass
@@ -60,11 +94,18 @@ class RuleConfig:
     rules: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     
     @classmethod
-    def from_yaml(cls, path: Path) -> 'RuleConfig':
-        """Load rules from YAML file."""
+    def from_yaml(cls, path: Path, stat_result: Optional[os.stat_result] = None) -> 'RuleConfig':
+        """
+        Load rules from YAML file.
+        
+        Args:
+            path: Path to the rules YAML file
+            stat_result: Optional stat of path already taken by the caller
+        """
         try:
-            with open(path, 'r') as f:
-                data = yaml.safe_load(f)
+            abs_path = os.path.abspath(path)
+            st = stat_result if stat_result is not None else os.stat(abs_path)
+            data = _load_yaml_cached(abs_path, st.st_mtime_ns, st.st_size)
             
             if not isinstance(data, dict):
                 raise ConfigurationError("Invalid rules file format")
@@ -77,6 +118,9 @@ class RuleConfig:
                 if isinstance(section_rules, dict):
                     for rule_id, rule_config in section_rules.items():
                         if isinstance(rule_config, dict) and 'name' in rule_config:
+                            # Copy so the cached parse result is never mutated
+                            rule_config = dict(rule_config)
+                            
                             # Convert specialty_level to level
                             if 'specialty_level' in rule_config:
                                 rule_config['level'] = 'specialty' if rule_config.get('specialty_level', False) else 'npi'
@@ -100,15 +144,17 @@ class RuleConfig:
     
     def get_rule(self, name: str) -> Dict[str, Any]:
         """Get a specific rule configuration."""
-        if name not in self.rules:
+        rule = self.rules.get(name, _MISSING)
+        if rule is _MISSING:
             raise ConfigurationError(f"Rule '{name}' not found")
-        return self.rules[name]
+        return rule
 
 
 @dataclass
 class ProcessingConfig:
     """Processing configuration."""
-    batch_size: int = 10000
+    batch_size: int = DEFAULT_BATCH_SIZE
+    fetch_arraysize: int = DEFAULT_FETCH_ARRAYSIZE
     dry_run: bool = False
     verbose: bool = False
     output_dir: Path = field(default_factory=lambda: Path('./reports'))
@@ -117,10 +163,11 @@ class ProcessingConfig:
         """Validate configuration after initialization."""
         if self.batch_size <= 0:
             raise ConfigurationError("Batch size must be positive")
+        if self.fetch_arraysize <= 0:
+            raise ConfigurationError("Fetch size must be positive")
         
-        # Ensure output directory exists
+        # The directory itself is created by ProcessingPipeline.initialize()
         self.output_dir = Path(self.output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
 
 
 @dataclass
@@ -135,9 +182,10 @@ class AppConfig:
         """Create configuration from command line arguments."""
         return cls(
             database=DatabaseConfig.from_env(),
-            rules=RuleConfig.from_yaml(Path(args.rules)),
+            rules=RuleConfig.from_yaml(Path(args.rules), getattr(args, 'rules_stat', None)),
             processing=ProcessingConfig(
                 batch_size=args.batch_size,
+                fetch_arraysize=getattr(args, 'fetch_size', DEFAULT_FETCH_ARRAYSIZE),
                 dry_run=args.dry_run,
                 verbose=args.verbose,
                 output_dir=Path(args.output)
@@ -1,16 +1,50 @@
 """Database connection management with persistent connection for volatile tables."""
 
+import random
+import threading
 import time
-from typing import Optional
-import teradatasql
+from typing import Any, Iterator, List, Optional, TYPE_CHECKING
 
 from .config import DatabaseConfig
-from .constants import CONNECTION_RETRY_ATTEMPTS
+from .constants import (
+    CIRCUIT_BREAKER_OPEN_SECONDS,
+    CONNECTION_RETRY_ATTEMPTS,
+    CONNECTION_MAX_BACKOFF_SECONDS,
+    DEFAULT_FETCH_ARRAYSIZE,
+    HEALTH_CHECK_TTL_SECONDS,
+    IDLE_VALIDATE_SECONDS,
+)
 from .exceptions import DatabaseConnectionError
 from ..utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import teradatasql
+
 logger = get_logger(__name__)
 
+# Guards singleton creation and connection setup across worker threads
+_CONN_LOCK = threading.Lock()
+
+
+def iter_batches(cursor: Any, arraysize: int = DEFAULT_FETCH_ARRAYSIZE) -> Iterator[List[tuple]]:
+    """
+    Stream fetchmany() batches from an executed cursor.
+    
+    Keeps at most one batch in memory instead of materializing the whole
+    result set with fetchall().
+    """
+    while True:
+        rows = cursor.fetchmany(arraysize)
+        if not rows:
+            return
+        yield rows
+
+
+def iter_rows(cursor: Any, arraysize: int = DEFAULT_FETCH_ARRAYSIZE) -> Iterator[tuple]:
+    """Stream individual rows from an executed cursor in fetchmany() batches."""
+    for rows in iter_batches(cursor, arraysize):
+        yield from rows
+
 
 class PersistentConnectionManager:
     """
@@ -20,65 +54,128 @@ class PersistentConnectionManager:
     """
     
     _instance: Optional['PersistentConnectionManager'] = None
-    _connection: Optional[teradatasql.TeradataConnection] = None
+    _connection: Optional['teradatasql.TeradataConnection'] = None
     
     def __new__(cls):
         """Singleton pattern to ensure only one connection manager exists."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        
+        with _CONN_LOCK:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
     
     def __init__(self):
         """Initialize connection manager."""
-        if not hasattr(self, '_initialized'):
-            self._initialized = True
-            self.config = DatabaseConfig.from_env()
-            self._is_connected = False
+        if getattr(self, '_initialized', False):
+            return
+        
+        with _CONN_LOCK:
+            if not getattr(self, '_initialized', False):
+                self.config = DatabaseConfig.from_env()
+                self._is_connected = False
+                self._last_health_check_ts = 0.0
+                self._last_health_ok = False
+                self._last_used_ts = 0.0
+                self._session_lost = False
+                self._circuit_open_until = 0.0
+                self._initialized = True
             
-    def get_connection(self) -> teradatasql.TeradataConnection:
+    def get_connection(self) -> 'teradatasql.TeradataConnection':
         """
         Get the persistent database connection.
         
-        Creates a new connection if none exists or if the existing one is closed.
+        Creates a new connection if none exists yet. The already-connected path
+        does not take the lock, and only probes the server when the connection
+        has been neither used nor checked for IDLE_VALIDATE_SECONDS.
+        
+        Raises:
+            DatabaseConnectionError: If the existing session was lost. It is not
+                silently replaced, because the volatile tables created so far
+                exist only in that session.
         """
-        if self._connection is None or not self._is_connected:
-            self._connection = self._create_connection()
-            self._is_connected = True
-        return self._connection
+        connection = self._connection
+        if connection is not None and self._is_connected:
+            now = time.monotonic()
+            idle = now - max(self._last_used_ts, self._last_health_check_ts)
+            if idle < IDLE_VALIDATE_SECONDS or self.is_connected(deep=True):
+                self._last_used_ts = now
+                return connection
+        
+        with _CONN_LOCK:
+            if self._connection is not None and not self._is_connected:
+                self._discard_lost_connection()
+            if self._session_lost:
+                raise DatabaseConnectionError(
+                    "Database session was lost; its volatile tables are gone, "
+                    "so processing must be restarted"
+                )
+            if self._connection is None:
+                self._connection = self._create_connection()
+                self._is_connected = True
+                # A fresh connection counts as validated
+                self._last_health_check_ts = time.monotonic()
+                self._last_health_ok = True
+            self._last_used_ts = time.monotonic()
+            return self._connection
     
-    def _create_connection(self) -> teradatasql.TeradataConnection:
+    def _discard_lost_connection(self) -> None:
+        """Close a connection that failed validation and mark its session lost."""
+        logger.error("Database connection failed validation; session state was lost")
+        try:
+            self._connection.close()
+        except Exception as e:
+            logger.debug(f"Error closing lost connection: {str(e)}")
+        self._connection = None
+        self._session_lost = True
+        self._invalidate_health()
+    
+    def _create_connection(self) -> 'teradatasql.TeradataConnection':
         """Create a new database connection with retry logic."""
-        params = self.config.to_connection_params()
+        # Deferred so modes that never connect don't pay for the driver import
+        import teradatasql
+        
+        # Fail fast while the circuit breaker is open after repeated failures
+        remaining = self._circuit_open_until - time.monotonic()
+        if remaining > 0:
+            raise DatabaseConnectionError(
+                f"Database connections suspended for {remaining:.0f}s after repeated failures"
+            )
+        
+        params = self.config.connection_params
         last_error = None
         
         for attempt in range(1, CONNECTION_RETRY_ATTEMPTS + 1):
             try:
                 logger.info(f"Connecting to database (attempt {attempt}/{CONNECTION_RETRY_ATTEMPTS})")
+                # connect() fails synchronously on bad host or credentials,
+                # so no verification query is needed
                 connection = teradatasql.connect(**params)
                 
-                # Test connection
-                cursor = connection.cursor()
-                cursor.execute("SELECT CURRENT_TIMESTAMP")
-                timestamp = cursor.fetchone()[0]
-                cursor.close()
-                
-                logger.info(f"Database connection established at {timestamp}")
+                logger.info("Database connection established")
                 return connection
                 
             except Exception as e:
                 last_error = e
+                self._invalidate_health()
                 logger.warning(f"Connection attempt {attempt} failed: {str(e)}")
                 
                 if attempt < CONNECTION_RETRY_ATTEMPTS:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    # Capped exponential backoff with jitter so retries don't stall for long
+                    delay = min(2 ** attempt, CONNECTION_MAX_BACKOFF_SECONDS)
+                    time.sleep(random.uniform(delay / 2, delay))
         
+        self._circuit_open_until = time.monotonic() + CIRCUIT_BREAKER_OPEN_SECONDS
         raise DatabaseConnectionError(
             f"Failed to connect after {CONNECTION_RETRY_ATTEMPTS} attempts: {str(last_error)}"
-        )
+        ) from last_error
     
     def close(self):
-        """Close the database connection."""
-        if self._connection and self._is_connected:
+        """Close the database connection; a later get_connection starts a new session."""
+        self._session_lost = False
+        if self._connection:
             try:
                 self._connection.close()
                 logger.info("Database connection closed")
@@ -87,21 +184,42 @@ class PersistentConnectionManager:
             finally:
                 self._connection = None
                 self._is_connected = False
+                self._invalidate_health()
     
-    def is_connected(self) -> bool:
-        """Check if connection is active."""
+    def is_connected(self, deep: bool = False) -> bool:
+        """
+        Check if connection is active.
+        
+        By default this only checks local state. With deep=True a SELECT 1
+        probe is sent, and its result is cached for HEALTH_CHECK_TTL_SECONDS
+        to avoid a round-trip on every status check.
+        """
         if not self._connection or not self._is_connected:
             return False
         
+        if not deep:
+            return True
+        
+        if time.monotonic() - self._last_health_check_ts < HEALTH_CHECK_TTL_SECONDS:
+            return self._last_health_ok
+        
         try:
             # Test the connection
             cursor = self._connection.cursor()
             cursor.execute("SELECT 1")
             cursor.close()
-            return True
+            self._last_health_ok = True
         except Exception:
             self._is_connected = False
-            return False
+            self._last_health_ok = False
+        
+        self._last_health_check_ts = time.monotonic()
+        return self._last_health_ok
+    
+    def _invalidate_health(self) -> None:
+        """Discard the cached health check result."""
+        self._last_health_check_ts = 0.0
+        self._last_health_ok = False
     
     @classmethod
     def reset(cls):
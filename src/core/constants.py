@@ -1,10 +1,28 @@
 """Constants used throughout the NPI Suppression Rule Engine."""
 
+from types import MappingProxyType
+
 # Database settings
 DEFAULT_BATCH_SIZE = 10000
 MAX_BATCH_SIZE = 200000
+# Rows requested per fetchmany() round-trip on large result sets (default for
+# --fetch-size). Very large values may also need bigger Teradata response
+# buffers on the session and hold more rows in memory per fetch.
+DEFAULT_FETCH_ARRAYSIZE = 10000
 CONNECTION_RETRY_ATTEMPTS = 3
+CONNECTION_MAX_BACKOFF_SECONDS = 30
+CIRCUIT_BREAKER_OPEN_SECONDS = 30
 CONNECTION_TIMEOUT = 30
+HEALTH_CHECK_TTL_SECONDS = 1.0
+IDLE_VALIDATE_SECONDS = 60
+
+# Report writing: rows per prefetched chunk and chunks buffered ahead of the writer
+REPORT_PREFETCH_CHUNK_ROWS = 10000
+REPORT_PREFETCH_DEPTH = 4
+# File buffer for CSV reports, so large reports reach the OS in 1 MiB writes
+REPORT_WRITE_BUFFER_BYTES = 1 << 20
+# Minimum seconds between progress messages while a CSV report is written
+REPORT_PROGRESS_INTERVAL_SECONDS = 5.0
 
 # NPI validation
 NPI_LENGTH = 10
@@ -17,14 +35,17 @@ class ProviderType:
     UNCATEGORIZED = 'uncategorized'
     UNKNOWN = 'unknown'
 
+# Table placeholders substituted in rule sql_query templates
+RULE_SQL_PLACEHOLDERS = frozenset({'npi_universe_table', 'base_table'})
+
 # Rule columns
-RULE_COLUMNS = [
+RULE_COLUMNS = (
     'start_1', 'start_2', 'specialty', 'end_date', 'term_date',
     'non_md_end_dt', 'provider_type', 'degree_cd'
-]
+)
 
-# Report file names
-REPORT_FILES = {
+# Report file names (read-only)
+REPORT_FILES = MappingProxyType({
     'summary': 'suppression_summary.txt',
     'universe': 'universe_validation_report.csv',
     'master': 'master_suppression_results.csv',
@@ -33,7 +54,7 @@ REPORT_FILES = {
     'rule_column': 'rule_column_impact_report.csv',
     'combination': 'rule_combination_analysis.csv',
     'detailed': 'detailed_npi_suppression_report.csv'
-}
+})
 
 # Logging format
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -1,16 +1,20 @@
 """Main processing pipeline orchestration."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import argparse
+import logging
 
-from .universe import UniverseProcessingOrchestrator
-from .rules import RuleProcessingOrchestrator
-from .reports import ReportGenerationOrchestrator
 from ..core.config import AppConfig
 from ..core.connections import PersistentConnectionManager
 from ..utils.logging_config import get_logger, setup_logging
 
+# Orchestrators pull in teradatasql and pandas; they are imported where used
+if TYPE_CHECKING:
+    from .universe import UniverseProcessingOrchestrator
+    from .rules import RuleProcessingOrchestrator
+    from .reports import ReportGenerationOrchestrator
+
 logger = get_logger(__name__)
 
 
@@ -20,14 +24,16 @@ class ProcessingPipeline:
     def __init__(self, config: AppConfig):
         self.config = config
         self.connection_manager: Optional[PersistentConnectionManager] = None
-        self.universe_orchestrator: Optional[UniverseProcessingOrchestrator] = None
-        self.rule_orchestrator: Optional[RuleProcessingOrchestrator] = None
-        self.report_orchestrator: Optional[ReportGenerationOrchestrator] = None
+        self.universe_orchestrator: Optional['UniverseProcessingOrchestrator'] = None
+        self.rule_orchestrator: Optional['RuleProcessingOrchestrator'] = None
+        self.report_orchestrator: Optional['ReportGenerationOrchestrator'] = None
     
     def initialize(self) -> bool:
         """Initialize all components."""
         try:
-            # Setup logging
+            # Setup logging; the output directory is created here, once per run,
+            # because processing.log is written into it
+            self.config.processing.output_dir.mkdir(parents=True, exist_ok=True)
             setup_logging(
                 level='DEBUG' if self.config.processing.verbose else 'INFO',
                 log_file=str(self.config.processing.output_dir / 'processing.log')
@@ -42,13 +48,17 @@ class ProcessingPipeline:
             if not connection:
                 raise Exception("Failed to establish database connection")
             
+            from .universe import UniverseProcessingOrchestrator
+            from .rules import RuleProcessingOrchestrator
+            
             # Initialize orchestrators with shared connection
             self.universe_orchestrator = UniverseProcessingOrchestrator(
                 self.connection_manager
             )
             self.rule_orchestrator = RuleProcessingOrchestrator(
                 self.connection_manager, 
-                self.config.processing.batch_size
+                self.config.processing.batch_size,
+                self.config.processing.fetch_arraysize
             )
             
             return True
@@ -73,9 +83,9 @@ class ProcessingPipeline:
             if not universe_results:
                 return False
             
-            # Generate universe report
+            # Generate universe report in the background while rules run
             self.universe_orchestrator.generate_universe_report(
-                self.config.processing.output_dir
+                self.config.processing.output_dir, background=True
             )
             
             # Step 2: Create practitioner universe
@@ -94,6 +104,8 @@ class ProcessingPipeline:
             
             # Step 6: Generate reports
             if self.rule_orchestrator.rule_engine:
+                from .reports import ReportGenerationOrchestrator
+                
                 self.report_orchestrator = ReportGenerationOrchestrator(
                     self.rule_orchestrator.rule_engine
                 )
@@ -101,7 +113,8 @@ class ProcessingPipeline:
                 report_paths = self.report_orchestrator.generate_all_reports(
                     self.config.processing.output_dir,
                     self.universe_orchestrator.universe_validator,
-                    self.config.processing.batch_size
+                    self.config.processing.batch_size,
+                    precomputed_universe_report=self.universe_orchestrator.wait_for_universe_report()
                 )
                 
                 # Log final statistics
@@ -120,26 +133,36 @@ class ProcessingPipeline:
         """Clean up all resources."""
         logger.info("Cleaning up processing resources")
         
+        # Closing the connection ends the session and releases every volatile
+        # table, so the per-table DROP round trips are only needed without one
+        drop_tables = self.connection_manager is None
+        
         if self.universe_orchestrator:
-            self.universe_orchestrator.cleanup()
+            self.universe_orchestrator.cleanup(drop_tables)
         
         if self.rule_orchestrator:
-            self.rule_orchestrator.cleanup()
+            self.rule_orchestrator.cleanup(drop_tables)
         
         if self.connection_manager:
             self.connection_manager.close()
     
     def _log_final_statistics(self) -> None:
         """Log final processing statistics."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         stats = self.rule_orchestrator.get_processing_statistics()
         if not stats:
             return
         
-        logger.info("=" * 70)
-        logger.info("FINAL PROCESSING STATISTICS")
-        logger.info("=" * 70)
-        logger.info(f"Total NPIs processed: {stats.get('total_npis', 0):,}")
-        logger.info(f"NPIs suppressed: {stats.get('suppressed_npis', 0):,}")
-        logger.info(f"NPIs unsuppressed: {stats.get('unsuppressed_npis', 0):,}")
-        logger.info(f"Processing time: {stats.get('processing_time', 'N/A')}")
-        logger.info("=" * 70)
\ No newline at end of file
+        # Logged as one record so the handlers are hit once
+        logger.info("\n".join([
+            "=" * 70,
+            "FINAL PROCESSING STATISTICS",
+            "=" * 70,
+            f"Total NPIs processed: {stats.get('total_npis', 0):,}",
+            f"NPIs suppressed: {stats.get('suppressed_npis', 0):,}",
+            f"NPIs unsuppressed: {stats.get('unsuppressed_npis', 0):,}",
+            f"Processing time: {stats.get('processing_time', 'N/A')}",
+            "=" * 70
+        ]))
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Report generation orchestration."""
 
+import logging
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -23,7 +24,8 @@ class ReportGenerationOrchestrator:
         self, 
         output_directory: Path, 
         universe_validator: UniverseValidator, 
-        batch_size: int
+        batch_size: int,
+        precomputed_universe_report: Optional[Path] = None
     ) -> Dict[str, Path]:
         """
         Generates comprehensive suite of analysis reports.
@@ -32,6 +34,8 @@ class ReportGenerationOrchestrator:
             output_directory: Directory for report output
             universe_validator: Validator instance for universe report
             batch_size: Batch size for large dataset processing
+            precomputed_universe_report: Universe report already written
+                earlier in the run; reused instead of writing it again
             
         Returns:
             Dictionary mapping report types to generated file paths
@@ -47,21 +51,18 @@ class ReportGenerationOrchestrator:
                 str(output_dir), batch_size
             )
             
-            # Generate universe validation report
-            universe_report_path = output_dir / 'universe_validation_report.csv'
-            self.report_orchestrator.generate_universe_validation_report(
-                str(universe_report_path), universe_validator
-            )
-            report_paths['universe_validation'] = str(universe_report_path)
-            
-            # Convert to Path objects
-            path_dict = {
-                report_type: Path(file_path) 
-                for report_type, file_path in report_paths.items()
-            }
+            # Generate universe validation report unless it already exists
+            if precomputed_universe_report is not None:
+                universe_report_path = precomputed_universe_report
+            else:
+                universe_report_path = output_dir / 'universe_validation_report.csv'
+                self.report_orchestrator.generate_universe_validation_report(
+                    str(universe_report_path), universe_validator
+                )
+            report_paths['universe_validation'] = universe_report_path
             
-            self._log_report_summary(path_dict)
-            return path_dict
+            self._log_report_summary(report_paths)
+            return report_paths
             
         except Exception as e:
             logger.error(f"Report generation failed: {str(e)}")
@@ -69,11 +70,17 @@ class ReportGenerationOrchestrator:
     
     def _log_report_summary(self, report_paths: Dict[str, Path]) -> None:
         """Logs summary of generated reports with file sizes."""
+        # Skips the per-file stat() calls as well when INFO is disabled
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         logger.info("Report generation completed successfully")
         
         for report_type, file_path in report_paths.items():
-            if file_path.exists():
+            try:
                 file_size = file_path.stat().st_size
-                logger.info(
-                    f"  {report_type}: {file_path.name} ({file_size:,} bytes)"
-                )
\ No newline at end of file
+            except FileNotFoundError:
+                continue
+            logger.info(
+                f"  {report_type}: {file_path.name} ({file_size:,} bytes)"
+            )
\ No newline at end of file
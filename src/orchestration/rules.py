@@ -3,6 +3,7 @@
 from typing import Optional, Dict, Any
 
 from ..processing.engine import SuppressionRuleEngine
+from ..core.constants import DEFAULT_FETCH_ARRAYSIZE
 from ..core.exceptions import RuleProcessingError
 from ..core.connections import PersistentConnectionManager
 from ..utils.logging_config import get_logger
@@ -13,9 +14,15 @@ logger = get_logger(__name__)
 class RuleProcessingOrchestrator:
     """Orchestrates suppression rule loading and execution."""
     
-    def __init__(self, connection_manager: PersistentConnectionManager, batch_size: int):
+    def __init__(
+        self,
+        connection_manager: PersistentConnectionManager,
+        batch_size: int,
+        fetch_arraysize: int = DEFAULT_FETCH_ARRAYSIZE
+    ):
         self.connection_manager = connection_manager
         self.batch_size = batch_size
+        self.fetch_arraysize = fetch_arraysize
         self.rule_engine: Optional[SuppressionRuleEngine] = None
     
     def execute_suppression_rules(
@@ -40,7 +47,9 @@ class RuleProcessingOrchestrator:
             
             # Get the persistent connection
             connection = self.connection_manager.get_connection()
-            self.rule_engine = SuppressionRuleEngine(connection, self.batch_size)
+            self.rule_engine = SuppressionRuleEngine(
+                connection, self.batch_size, self.fetch_arraysize
+            )
             
             logger.info("STEP 4: Loading suppression rules from configuration")
             self.rule_engine.load_rules_from_configuration(config)
@@ -68,11 +77,11 @@ class RuleProcessingOrchestrator:
             logger.warning(f"Failed to get processing statistics: {str(e)}")
             return None
     
-    def cleanup(self) -> None:
+    def cleanup(self, drop_tables: bool = True) -> None:
         """Cleans up rule processing resources."""
         if self.rule_engine:
             try:
-                self.rule_engine.cleanup()
+                self.rule_engine.cleanup(drop_tables)
                 logger.debug("Rule processing resources cleaned up")
             except Exception as e:
                 logger.warning(f"Error during rule cleanup: {str(e)}")
\ No newline at end of file
@@ -3,6 +3,8 @@
 from pathlib import Path
 from typing import Optional, Any
 import argparse
+import logging
+import threading
 
 from ..core.exceptions import UniverseValidationError
 from ..core.connections import PersistentConnectionManager
@@ -19,6 +21,8 @@ class UniverseProcessingOrchestrator:
         self.connection_manager = connection_manager
         self.universe_validator: Optional[UniverseValidator] = None
         self.validation_results: Optional[Any] = None
+        self.universe_report_path: Optional[Path] = None
+        self._report_thread: Optional[threading.Thread] = None
     
     def process_universe_data(self, args: argparse.Namespace) -> Optional[Any]:
         """
@@ -80,12 +84,14 @@ class UniverseProcessingOrchestrator:
             logger.error(f"Failed to create practitioner universe: {str(e)}")
             raise UniverseValidationError(f"Failed to create practitioner universe: {str(e)}")
     
-    def generate_universe_report(self, output_dir: Path) -> Optional[Path]:
+    def generate_universe_report(self, output_dir: Path, background: bool = False) -> Optional[Path]:
         """
         Generates universe validation report.
         
         Args:
             output_dir: Directory for output reports
+            background: Write the report on a separate thread so the file
+                writes overlap later database work; see wait_for_universe_report
             
         Returns:
             Path to generated report or None if generation failed
@@ -94,8 +100,34 @@ class UniverseProcessingOrchestrator:
             logger.warning("No validation results available for report generation")
             return None
         
+        report_path = output_dir / 'universe_validation_report.csv'
+        self.universe_report_path = report_path
+        
+        if background:
+            self._report_thread = threading.Thread(
+                target=self._write_universe_report, args=(report_path,),
+                name='universe-report', daemon=True
+            )
+            self._report_thread.start()
+            return report_path
+        
+        return self._write_universe_report(report_path)
+    
+    def wait_for_universe_report(self) -> Optional[Path]:
+        """
+        Waits for a background universe report to finish.
+        
+        Returns:
+            Path to the written report or None if generation failed
+        """
+        if self._report_thread:
+            self._report_thread.join()
+            self._report_thread = None
+        return self.universe_report_path
+    
+    def _write_universe_report(self, report_path: Path) -> Optional[Path]:
+        """Writes the universe validation report, clearing the path on failure."""
         try:
-            report_path = output_dir / 'universe_validation_report.csv'
             self.universe_validator.generate_universe_report(
                 str(report_path), self.validation_results
             )
@@ -103,33 +135,40 @@ class UniverseProcessingOrchestrator:
             
         except Exception as e:
             logger.error(f"Failed to generate universe report: {str(e)}")
+            self.universe_report_path = None
             return None
     
-    def cleanup(self) -> None:
+    def cleanup(self, drop_tables: bool = True) -> None:
         """Cleanup universe processing resources."""
+        self.wait_for_universe_report()
+        
         if self.universe_validator:
             try:
-                self.universe_validator.cleanup()
+                self.universe_validator.cleanup(drop_tables)
                 logger.debug("Universe processing resources cleaned up")
             except Exception as e:
                 logger.warning(f"Error during universe cleanup: {str(e)}")
     
     def _log_universe_summary(self) -> None:
         """Logs summary of universe processing results."""
-        if not self.validation_results:
+        if not self.validation_results or not logger.isEnabledFor(logging.INFO):
             return
         
         counts = self.validation_results.provider_type_counts
-        logger.info("=" * 70)
-        logger.info("UNIVERSE PROCESSING SUMMARY")
-        logger.info("=" * 70)
-        logger.info(f"Total NPIs processed: {counts.total:,}")
-        logger.info("Provider Type Distribution:")
-        logger.info(f"  Practitioners: {counts.practitioners:,} ({counts.practitioner_percentage:.1f}%) -> Rule processing")
-        logger.info(f"  Facilities: {counts.facilities:,} ({counts.facility_percentage:.1f}%) -> Provider type suppression")
-        logger.info(f"  Ancillary: {counts.ancillary:,} ({counts.ancillary_percentage:.1f}%) -> Provider type suppression")
-        logger.info(f"  Uncategorized: {counts.uncategorized:,} ({counts.uncategorized_percentage:.1f}%) -> Provider type suppression")
-        logger.info("Processing Impact:")
-        logger.info(f"  NPIs entering rule pipeline: {counts.practitioners:,} ({counts.practitioner_percentage:.1f}%)")
-        logger.info(f"  NPIs suppressed by provider type: {counts.non_practitioner_count:,} ({counts.non_practitioner_percentage:.1f}%)")
-        logger.info("=" * 70)
\ No newline at end of file
+        
+        # Logged as one record so the handlers are hit once
+        logger.info("\n".join([
+            "=" * 70,
+            "UNIVERSE PROCESSING SUMMARY",
+            "=" * 70,
+            f"Total NPIs processed: {counts.total:,}",
+            "Provider Type Distribution:",
+            f"  Practitioners: {counts.practitioners:,} ({counts.practitioner_percentage:.1f}%) -> Rule processing",
+            f"  Facilities: {counts.facilities:,} ({counts.facility_percentage:.1f}%) -> Provider type suppression",
+            f"  Ancillary: {counts.ancillary:,} ({counts.ancillary_percentage:.1f}%) -> Provider type suppression",
+            f"  Uncategorized: {counts.uncategorized:,} ({counts.uncategorized_percentage:.1f}%) -> Provider type suppression",
+            "Processing Impact:",
+            f"  NPIs entering rule pipeline: {counts.practitioners:,} ({counts.practitioner_percentage:.1f}%)",
+            f"  NPIs suppressed by provider type: {counts.non_practitioner_count:,} ({counts.non_practitioner_percentage:.1f}%)",
+            "=" * 70
+        ]))
\ No newline at end of file
@@ -7,21 +7,32 @@ suppression and unsuppression outcomes.
 
 import time
 import uuid
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
 import teradatasql
 
 from .rules import SuppressionRule, RuleExecutionResult, RuleLoader
-from .tables import TableManager
+from .tables import TableManager, inserted_row_count
+from ..core.constants import DEFAULT_BATCH_SIZE, DEFAULT_FETCH_ARRAYSIZE
 from ..core.exceptions import RuleProcessingError
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+def _percentage(part: int, whole: int) -> float:
+    """Percentage of part in whole, 0.0 when whole is empty."""
+    return (part / whole * 100) if whole > 0 else 0.0
+
+
+@dataclass(frozen=True)
 class ProcessingStatistics:
-    """Statistics from master results processing."""
+    """
+    Statistics from master results processing.
+    
+    NPI counts overlap: an NPI with some specialties suppressed and others
+    not is counted in both suppressed_npis and unsuppressed_npis.
+    """
     total_combinations: int
     suppressed_combinations: int
     unsuppressed_combinations: int
@@ -29,25 +40,21 @@ class ProcessingStatistics:
     suppressed_npis: int
     unsuppressed_npis: int
     
-    @property
-    def combination_suppression_rate(self) -> float:
-        """Percentage of combinations suppressed."""
-        return (self.suppressed_combinations / self.total_combinations * 100) if self.total_combinations > 0 else 0.0
+    # Rates in percent, computed once from the counts above
+    combination_suppression_rate: float = field(init=False)
+    combination_unsuppression_rate: float = field(init=False)
+    npi_suppression_rate: float = field(init=False)
+    npi_unsuppression_rate: float = field(init=False)
     
-    @property
-    def combination_unsuppression_rate(self) -> float:
-        """Percentage of combinations that remain unsuppressed."""
-        return (self.unsuppressed_combinations / self.total_combinations * 100) if self.total_combinations > 0 else 0.0
-    
-    @property
-    def npi_suppression_rate(self) -> float:
-        """Percentage of unique NPIs suppressed."""
-        return (self.suppressed_npis / self.unique_npis * 100) if self.unique_npis > 0 else 0.0
-    
-    @property
-    def npi_unsuppression_rate(self) -> float:
-        """Percentage of unique NPIs that remain unsuppressed."""
-        return (self.unsuppressed_npis / self.unique_npis * 100) if self.unique_npis > 0 else 0.0
+    def __post_init__(self):
+        object.__setattr__(self, 'combination_suppression_rate',
+                           _percentage(self.suppressed_combinations, self.total_combinations))
+        object.__setattr__(self, 'combination_unsuppression_rate',
+                           _percentage(self.unsuppressed_combinations, self.total_combinations))
+        object.__setattr__(self, 'npi_suppression_rate',
+                           _percentage(self.suppressed_npis, self.unique_npis))
+        object.__setattr__(self, 'npi_unsuppression_rate',
+                           _percentage(self.unsuppressed_npis, self.unique_npis))
 
 
 class SuppressionRuleEngine:
@@ -58,16 +65,23 @@ class SuppressionRuleEngine:
     of both suppression and unsuppression outcomes.
     """
     
-    def __init__(self, connection: teradatasql.TeradataConnection, batch_size: int = 10000):
+    def __init__(
+        self,
+        connection: teradatasql.TeradataConnection,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fetch_arraysize: int = DEFAULT_FETCH_ARRAYSIZE
+    ):
         """
         Initialize the suppression rule engine.
         
         Args:
             connection: Persistent database connection
             batch_size: Batch size for large dataset processing
+            fetch_arraysize: Rows per fetch round trip when reading results
         """
         self.connection = connection
         self.batch_size = batch_size
+        self.fetch_arraysize = fetch_arraysize
         self.session_id = str(uuid.uuid4()).replace('-', '')[:8]
         
         # Component initialization
@@ -81,6 +95,8 @@ class SuppressionRuleEngine:
         self.practitioner_universe_table: Optional[str] = None
         self.base_combinations_table: Optional[str] = None
         self.master_results_table: Optional[str] = None
+        self.npi_summary_table: Optional[str] = None
+        self.master_rule_ids: List[str] = []
         self.processing_statistics: Optional[ProcessingStatistics] = None
         
         # Database impact tracking
@@ -132,6 +148,9 @@ class SuppressionRuleEngine:
             logger.info("Creating master results table with comprehensive outcomes")
             self.master_results_table = self._create_master_results_table()
             
+            # Aggregate master results per NPI once for statistics and reports
+            self.npi_summary_table = self._create_npi_summary_table()
+            
             # Calculate processing statistics
             self._calculate_processing_statistics()
             
@@ -161,17 +180,28 @@ class SuppressionRuleEngine:
             'unsuppression_rate': self.processing_statistics.npi_unsuppression_rate
         }
     
-    def cleanup(self) -> None:
-        """Cleans up all resources and tables."""
+    def cleanup(self, drop_tables: bool = True) -> None:
+        """
+        Cleans up all resources and tables.
+        
+        Args:
+            drop_tables: Drop volatile tables; False when the session is closing anyway
+        """
         logger.info("Cleaning up rule engine resources")
         
         if self.table_manager:
-            self.table_manager.cleanup_all_tables()
+            self.table_manager.cleanup_all_tables(drop_tables)
     
     def _create_base_combinations_table(self, practitioner_universe_table: str) -> str:
-        """Creates base table with all NPI-specialty combinations."""
+        """
+        Creates base table with all NPI-specialty combinations.
+        
+        NPIs are always 10 digits, so the engine's tables store them as
+        fixed-width CHAR(10). concat_key keeps its VARCHAR form because rule
+        queries filter on it.
+        """
         columns = [
-            {'name': 'npi', 'type': 'VARCHAR(10)'},
+            {'name': 'npi', 'type': 'CHAR(10)'},
             {'name': 'specialty_name', 'type': 'VARCHAR(200)'},
             {'name': 'concat_key', 'type': 'VARCHAR(250)'}
         ]
@@ -180,29 +210,42 @@ class SuppressionRuleEngine:
             'base_combinations', columns, primary_index='npi,specialty_name'
         )
         
-        # Populate with NPI-specialty combinations from practitioner data
+        # Populate with NPI-specialty combinations from practitioner data.
+        # Education and products only decide whether a practitioner qualifies,
+        # so they are semi-joins (EXISTS) rather than joins that fan out the
+        # rows. Remaining duplicates are removed with GROUP BY, which
+        # aggregates locally on each AMP before redistributing.
         insert_sql = f"""
         INSERT INTO {table_name} (npi, specialty_name, concat_key)
-        SELECT DISTINCT 
-            CAST(A.NPI AS VARCHAR(10)) as npi,
+        SELECT 
+            CAST(A.NPI AS CHAR(10)) as npi,
             CAST(SP.SpecialtyName AS VARCHAR(200)) as specialty_name,
             TRIM(CAST(A.NPI AS VARCHAR(10)) || '-' || CAST(SP.SpecialtyName AS VARCHAR(200))) as concat_key
         FROM PROVIDERDATASERVICE_CORE_V.PROV_SPAYER_practitioners p
         JOIN {practitioner_universe_table} A ON A.npi = p.NationalProviderID
         JOIN PROVIDERDATASERVICE_CORE_V.PROV_SPAYER_PRACTITIONERSPECIALTIES PRSP ON p.PractitionerID = PRSP.PractitionerID
-        JOIN PROVIDERDATASERVICE_CORE_V.PROV_SPAYER_PRACTITIONEREDUCATION PE ON PRSP.PractitionerID = PE.PractitionerID
-        JOIN PROVIDERDATASERVICE_CORE_V.PROV_SPAYER_PRACTITIONERPRODUCTS PRPROD ON PRSP.PRACTITIONERID = PRPROD.PRACTITIONERID
-        JOIN PROVIDERDATASERVICE_CORE_V.PROV_SPAYER_PRACTITIONERPRODUCTSPECIALTIES PRPRODSP ON PRPRODSP.PRACTITIONERPRODUCTRECID = PRPROD.PRACTITIONERPRODUCTRECID
         JOIN PROVIDERDATASERVICE_CORE_V.PROV_SPAYER_SPECIALTIES SP ON PRSP.SPECIALTYID = SP.SPECIALTYID
         WHERE A.NPI IS NOT NULL AND SP.SpecialtyName IS NOT NULL
+        AND EXISTS (
+            SELECT 1
+            FROM PROVIDERDATASERVICE_CORE_V.PROV_SPAYER_PRACTITIONEREDUCATION PE
+            WHERE PE.PractitionerID = PRSP.PractitionerID
+        )
+        AND EXISTS (
+            SELECT 1
+            FROM PROVIDERDATASERVICE_CORE_V.PROV_SPAYER_PRACTITIONERPRODUCTS PRPROD
+            JOIN PROVIDERDATASERVICE_CORE_V.PROV_SPAYER_PRACTITIONERPRODUCTSPECIALTIES PRPRODSP ON PRPRODSP.PRACTITIONERPRODUCTRECID = PRPROD.PRACTITIONERPRODUCTRECID
+            WHERE PRPROD.PRACTITIONERID = PRSP.PRACTITIONERID
+        )
+        GROUP BY A.NPI, SP.SpecialtyName
         """
         
-        cursor = self.connection.cursor()
+        cursor = self.table_manager.get_cursor()
         cursor.execute(insert_sql)
         
-        # Get count
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count = cursor.fetchone()[0]
+        count = inserted_row_count(cursor, table_name)
+        if count:
+            self.table_manager.collect_statistics(table_name, ['npi', 'npi,specialty_name'])
         
         logger.info(f"Created base combinations table with {count:,} NPI-specialty pairs")
         return table_name
@@ -213,36 +256,43 @@ class SuppressionRuleEngine:
         start_time = time.time()
         
         try:
-            # Create rule result table based on rule level
+            # Create rule result table based on rule level, with the primary
+            # index on the key the master results aggregate on so rule rows
+            # are already on the right AMP
             if rule.is_specialty_level:
                 columns = [
-                    {'name': 'npi', 'type': 'VARCHAR(10)'},
-                    {'name': 'specialty_name', 'type': 'VARCHAR(200)'},
-                    {'name': 'concat_key', 'type': 'VARCHAR(250)'}
+                    {'name': 'npi', 'type': 'CHAR(10)'},
+                    {'name': 'specialty_name', 'type': 'VARCHAR(200)'}
                 ]
+                primary_index = 'npi,specialty_name'
             else:
                 columns = [
-                    {'name': 'npi', 'type': 'VARCHAR(10)'}
+                    {'name': 'npi', 'type': 'CHAR(10)'}
                 ]
+                primary_index = 'npi'
             
             result_table = self.table_manager.create_volatile_table(
-                f"rule_{rule.rule_id}", columns
+                f"rule_{rule.rule_id}", columns, primary_index=primary_index
             )
             
             # Format rule query by replacing template variables
-            formatted_query = rule.sql_query.replace('{npi_universe_table}', self.practitioner_universe_table)
-            formatted_query = formatted_query.replace('{base_table}', self.base_combinations_table)
+            formatted_query = rule.render_sql(
+                npi_universe_table=self.practitioner_universe_table,
+                base_table=self.base_combinations_table
+            )
             
             # Build appropriate INSERT statement based on rule level
-            cursor = self.connection.cursor()
+            cursor = self.table_manager.get_cursor()
             if rule.is_specialty_level:
-                # Specialty-level rules return npi, specialty_name - we need to add concat_key
+                # Specialty-level rules return npi, specialty_name; master results
+                # match them on those columns, so no concat_key is built here.
+                # Skip the outer DISTINCT when the rule query already deduplicates.
+                select_clause = "SELECT" if rule.results_unique else "SELECT DISTINCT"
                 insert_sql = f"""
-                INSERT INTO {result_table} (npi, specialty_name, concat_key)
-                SELECT DISTINCT 
-                    CAST(rule_results.npi AS VARCHAR(10)) as npi,
-                    CAST(rule_results.specialty_name AS VARCHAR(200)) as specialty_name,
-                    TRIM(CAST(rule_results.npi AS VARCHAR(10)) || '-' || CAST(rule_results.specialty_name AS VARCHAR(200))) as concat_key
+                INSERT INTO {result_table} (npi, specialty_name)
+                {select_clause} 
+                    CAST(rule_results.npi AS CHAR(10)) as npi,
+                    CAST(rule_results.specialty_name AS VARCHAR(200)) as specialty_name
                 FROM ({formatted_query}) AS rule_results
                 WHERE rule_results.npi IS NOT NULL AND rule_results.specialty_name IS NOT NULL
                 """
@@ -254,9 +304,9 @@ class SuppressionRuleEngine:
                 """
             cursor.execute(insert_sql)
             
-            # Get matched count
-            cursor.execute(f"SELECT COUNT(*) FROM {result_table}")
-            matched_count = cursor.fetchone()[0]
+            matched_count = inserted_row_count(cursor, result_table)
+            if matched_count:
+                self.table_manager.collect_statistics(result_table, [primary_index])
             
             execution_time = time.time() - start_time
             
@@ -289,7 +339,7 @@ class SuppressionRuleEngine:
         """Creates master results table combining all rule outcomes."""
         # Build column list for master table
         base_columns = [
-            {'name': 'npi', 'type': 'VARCHAR(10)'},
+            {'name': 'npi', 'type': 'CHAR(10)'},
             {'name': 'specialty_name', 'type': 'VARCHAR(200)'},
             {'name': 'concat_key', 'type': 'VARCHAR(250)'},
             {'name': 'rule_combination_key', 'type': 'VARCHAR(1000)'},
@@ -297,49 +347,56 @@ class SuppressionRuleEngine:
             {'name': 'unsuppression_flag', 'type': 'CHAR(1)'}
         ]
         
-        # Add columns for each successful rule only
-        successful_rule_ids = []
-        for rule_id, rule in self.rules.items():
-            result = self.rule_execution_results.get(rule_id)
-            if result and result.success:
-                successful_rule_ids.append(rule_id)
-                base_columns.append({
-                    'name': f"rule_{rule_id}_flag",
-                    'type': 'CHAR(1)'
-                })
-        
-        master_table = self.table_manager.create_volatile_table(
-            'master_results', base_columns, primary_index='npi,specialty_name'
-        )
-        
-        # Build dynamic SQL to populate master table - only include successful rules
+        # Build dynamic SQL to populate master table - only include successful rules.
+        # Rule hits are stacked with UNION ALL and folded into one row per key
+        # with GROUP BY, instead of one LEFT JOIN per rule: specialty-level
+        # hits are grouped together with the base rows on (npi, specialty_name),
+        # NPI-level hits are grouped on npi and joined once.
         rule_case_statements = []
-        rule_joins = []
+        specialty_branches = [
+            f"SELECT npi, specialty_name, concat_key, CAST(0 AS INTEGER) AS src "
+            f"FROM {self.base_combinations_table}"
+        ]
+        specialty_hits = []
+        npi_branches = []
+        npi_hits = []
         successful_rules = []
         failed_rules = []
         
+        # Single pass over the rules: flag column, union branch and hit per rule
         for rule_id, rule in self.rules.items():
             result = self.rule_execution_results.get(rule_id)
-            if result and result.success:
-                successful_rules.append(rule_id)
-                rule_alias = f"r_{rule_id}"
-                rule_case_statements.append(
-                    f"CASE WHEN {rule_alias}.npi IS NOT NULL THEN 'Y' ELSE 'N' END AS rule_{rule_id}_flag"
+            if not (result and result.success):
+                failed_rules.append(rule_id)
+                continue
+            
+            successful_rules.append(rule_id)
+            src = len(successful_rules)
+            base_columns.append({'name': f"rule_{rule_id}_flag", 'type': 'CHAR(1)'})
+            hit = f"MAX(CASE WHEN src = {src} THEN 'Y' END) AS hit_{src}"
+            
+            if rule.is_specialty_level:
+                specialty_branches.append(
+                    f"SELECT npi, specialty_name, NULL, {src} FROM {result.table_name}"
                 )
-                
-                if rule.is_specialty_level:
-                    rule_joins.append(
-                        f"LEFT JOIN {result.table_name} {rule_alias} "
-                        f"ON b.concat_key = {rule_alias}.concat_key"
-                    )
-                else:
-                    rule_joins.append(
-                        f"LEFT JOIN {result.table_name} {rule_alias} "
-                        f"ON b.npi = {rule_alias}.npi"
-                    )
+                specialty_hits.append(hit)
+                hit_alias = 'c'
             else:
-                failed_rules.append(rule_id)
+                npi_branches.append(
+                    f"SELECT npi, CAST({src} AS INTEGER) AS src FROM {result.table_name}"
+                )
+                npi_hits.append(hit)
+                hit_alias = 'n'
+            
+            rule_case_statements.append(
+                f"COALESCE({hit_alias}.hit_{src}, 'N') AS rule_{rule_id}_flag"
+            )
+        
+        master_table = self.table_manager.create_volatile_table(
+            'master_results', base_columns, primary_index='npi,specialty_name'
+        )
         
+        self.master_rule_ids = successful_rules
         logger.info(f"Master results will include {len(successful_rules)} successful rules: {successful_rules}")
         if failed_rules:
             logger.warning(f"Excluding {len(failed_rules)} failed rules: {failed_rules}")
@@ -360,63 +417,121 @@ class SuppressionRuleEngine:
             unsuppression_logic = "'Y'"
             rule_columns = ""
         
+        # Keep only keys present in the base table (src 0)
+        combinations_sql = f"""
+        SELECT 
+            npi,
+            specialty_name,
+            MAX(concat_key) AS concat_key{''.join(', ' + h for h in specialty_hits)}
+        FROM (
+            {' UNION ALL '.join(specialty_branches)}
+        ) u
+        GROUP BY npi, specialty_name
+        HAVING MIN(src) = 0
+        """
+        
+        npi_join = ""
+        if npi_branches:
+            npi_join = f"""
+        LEFT JOIN (
+            SELECT npi, {', '.join(npi_hits)}
+            FROM (
+                {' UNION ALL '.join(npi_branches)}
+            ) u
+            GROUP BY npi
+        ) n ON c.npi = n.npi"""
+        
         # Build and execute insert
         insert_sql = f"""
         INSERT INTO {master_table}
         SELECT 
-            b.npi,
-            b.specialty_name,
-            b.concat_key,
+            c.npi,
+            c.specialty_name,
+            c.concat_key,
             {combination_key} as rule_combination_key,
             {suppression_logic} as suppression_flag,
             {unsuppression_logic} as unsuppression_flag{rule_columns}
-        FROM {self.base_combinations_table} b
-        {' '.join(rule_joins)}
+        FROM ({combinations_sql}) c{npi_join}
         """
         
-        cursor = self.connection.cursor()
+        cursor = self.table_manager.get_cursor()
         cursor.execute(insert_sql)
         
-        # Get record count
-        cursor.execute(f"SELECT COUNT(*) FROM {master_table}")
-        count = cursor.fetchone()[0]
+        count = inserted_row_count(cursor, master_table)
         
         logger.info(f"Master results table created with {count:,} records")
         return master_table
     
-    def _calculate_processing_statistics(self) -> None:
-        """Calculates comprehensive processing statistics."""
-        cursor = self.connection.cursor()
+    def _create_npi_summary_table(self) -> str:
+        """
+        Creates a per-NPI rollup of master results.
         
-        # Get combination counts
-        cursor.execute(f"""
+        Holds each NPI's combination and suppressed-combination counts and,
+        per rule, whether any of its combinations was flagged. Statistics and
+        reports aggregate this table instead of grouping master results by
+        npi again for every query.
+        """
+        columns = [
+            {'name': 'npi', 'type': 'CHAR(10)'},
+            {'name': 'combinations', 'type': 'INTEGER'},
+            {'name': 'suppressed_combinations', 'type': 'INTEGER'}
+        ]
+        columns.extend(
+            {'name': f"rule_{rule_id}_flag", 'type': 'CHAR(1)'} for rule_id in self.master_rule_ids
+        )
+        
+        table_name = self.table_manager.create_volatile_table(
+            'npi_summary', columns, primary_index='npi'
+        )
+        
+        # 'Y' sorts after 'N', so MAX marks NPIs flagged on any specialty
+        rule_flags = ''.join(
+            f", MAX(rule_{rule_id}_flag)" for rule_id in self.master_rule_ids
+        )
+        insert_sql = f"""
+        INSERT INTO {table_name}
         SELECT 
-            COUNT(*) as total_combinations,
-            SUM(CASE WHEN suppression_flag = 'Y' THEN 1 ELSE 0 END) as suppressed,
-            SUM(CASE WHEN suppression_flag = 'N' THEN 1 ELSE 0 END) as unsuppressed
+            npi,
+            COUNT(*),
+            SUM(CASE WHEN suppression_flag = 'Y' THEN 1 ELSE 0 END){rule_flags}
         FROM {self.master_results_table}
-        """)
+        GROUP BY npi
+        """
         
-        combo_stats = cursor.fetchone()
+        cursor = self.table_manager.get_cursor()
+        cursor.execute(insert_sql)
+        count = inserted_row_count(cursor, table_name)
+        
+        logger.info(f"NPI summary table created with {count:,} NPIs")
+        return table_name
+    
+    def _calculate_processing_statistics(self) -> None:
+        """Calculates comprehensive processing statistics in a single scan."""
+        cursor = self.table_manager.get_cursor()
         
-        # Get unique NPI counts
+        # Combination and unique NPI counts from one pass over the per-NPI
+        # summary, which replaces COUNT(DISTINCT npi) aggregations.
+        # suppression_flag is always 'Y' or 'N', so unsuppressed counts
+        # follow from the others.
         cursor.execute(f"""
         SELECT 
-            COUNT(DISTINCT npi) as unique_npis,
-            COUNT(DISTINCT CASE WHEN suppression_flag = 'Y' THEN npi END) as suppressed_npis,
-            COUNT(DISTINCT CASE WHEN suppression_flag = 'N' THEN npi END) as unsuppressed_npis
-        FROM {self.master_results_table}
+            COALESCE(SUM(combinations), 0) as total_combinations,
+            COALESCE(SUM(suppressed_combinations), 0) as suppressed,
+            COUNT(*) as unique_npis,
+            COALESCE(SUM(CASE WHEN suppressed_combinations > 0 THEN 1 ELSE 0 END), 0) as suppressed_npis,
+            COALESCE(SUM(CASE WHEN suppressed_combinations < combinations THEN 1 ELSE 0 END), 0) as unsuppressed_npis
+        FROM {self.npi_summary_table}
         """)
         
-        npi_stats = cursor.fetchone()
+        total_combinations, suppressed_combinations, unique_npis, suppressed_npis, unsuppressed_npis = cursor.fetchone()
         
         self.processing_statistics = ProcessingStatistics(
-            total_combinations=combo_stats[0],
-            suppressed_combinations=combo_stats[1],
-            unsuppressed_combinations=combo_stats[2],
-            unique_npis=npi_stats[0],
-            suppressed_npis=npi_stats[1],
-            unsuppressed_npis=npi_stats[2]
+            total_combinations=total_combinations,
+            suppressed_combinations=suppressed_combinations,
+            unsuppressed_combinations=total_combinations - suppressed_combinations,
+            unique_npis=unique_npis,
+            suppressed_npis=suppressed_npis,
+            unsuppressed_npis=unsuppressed_npis
         )
         
         logger.info(f"Processing statistics calculated:")
@@ -428,24 +543,9 @@ class SuppressionRuleEngine:
                    f"({self.processing_statistics.npi_suppression_rate:.1f}%)")
     
     def _calculate_database_impact(self) -> None:
-        """Calculates the impact on Spayer database tables."""
-        cursor = self.connection.cursor()
-        
-        # NPIs to suppress
-        cursor.execute(f"""
-        SELECT COUNT(DISTINCT npi)
-        FROM {self.master_results_table}
-        WHERE suppression_flag = 'Y'
-        """)
-        npis_count = cursor.fetchone()[0]
-        
-        # NPI-specialty combinations to suppress
-        cursor.execute(f"""
-        SELECT COUNT(*)
-        FROM {self.master_results_table}
-        WHERE suppression_flag = 'Y'
-        """)
-        combinations_count = cursor.fetchone()[0]
+        """Calculates the impact on Spayer database tables from processing statistics."""
+        npis_count = self.processing_statistics.suppressed_npis
+        combinations_count = self.processing_statistics.suppressed_combinations
         
         self.database_impact = {
             'npis_to_suppress': npis_count,
@@ -1,14 +1,28 @@
 """Rule definition and management."""
 
-from dataclasses import dataclass
+import json
+import re
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
+from ..core.constants import RULE_SQL_PLACEHOLDERS
 from ..core.exceptions import RuleProcessingError
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Only the known table placeholders are substituted; any other braces (e.g. a
+# regex quantifier in a string literal) are literal SQL
+_PLACEHOLDER_PATTERN = re.compile(
+    r'\{(' + '|'.join(sorted(map(re.escape, RULE_SQL_PLACEHOLDERS))) + r')\}'
+)
+# SELECT or Teradata's SEL, after any leading whitespace, comments and parentheses
+_QUERY_START_PATTERN = re.compile(
+    r'(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/|\()*SEL(?:ECT)?\b', re.IGNORECASE | re.DOTALL
+)
+
 
 class RuleLevel(Enum):
     """Defines the level at which a rule operates."""
@@ -16,7 +30,7 @@ class RuleLevel(Enum):
     SPECIALTY_LEVEL = "specialty"
 
 
-@dataclass
+@dataclass(frozen=True)
 class SuppressionRule:
     """Container for a single suppression rule definition."""
     rule_id: str
@@ -25,6 +39,35 @@ class SuppressionRule:
     sql_query: str
     level: RuleLevel
     enabled: bool = True
+    results_unique: bool = False
+    # Alternating literal SQL and placeholder names, split once at load time
+    _segments: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Rule SQL is embedded in INSERT ... SELECT (and, for specialty rules,
+        # a derived table), so it has to be a plain SELECT
+        if not _QUERY_START_PATTERN.match(self.sql_query):
+            raise RuleProcessingError(
+                f"Rule '{self.rule_id}' sql_query must be a SELECT query"
+            )
+        
+        segments = tuple(_PLACEHOLDER_PATTERN.split(self.sql_query))
+        object.__setattr__(self, '_segments', segments)
+    
+    def render_sql(self, **tables: str) -> str:
+        """
+        Substitutes table names into the rule's SQL template.
+        
+        Args:
+            **tables: Table name for each placeholder used by the rule
+            
+        Returns:
+            Executable SQL query
+        """
+        parts = list(self._segments)
+        for i in range(1, len(parts), 2):
+            parts[i] = tables[parts[i]]
+        return ''.join(parts)
     
     @property
     def is_specialty_level(self) -> bool:
@@ -48,6 +91,12 @@ class RuleExecutionResult:
     error_message: Optional[str] = None
 
 
+def _selects_distinct(sql_query: str) -> bool:
+    """Returns True if the query's outermost SELECT is already DISTINCT."""
+    normalized = ' '.join(sql_query.split()).upper()
+    return normalized.startswith('SELECT DISTINCT ') and ' UNION ALL ' not in normalized
+
+
 class RuleLoader:
     """Loads and validates suppression rules from configuration."""
     
@@ -56,56 +105,92 @@ class RuleLoader:
         """
         Loads suppression rules from configuration dictionary.
         
+        Rules are memoized on the serialized configuration, so loading an
+        identical configuration again reuses the (immutable) rule objects.
+        
         Args:
             config: Configuration dictionary containing rules
             
         Returns:
             Dictionary mapping rule IDs to SuppressionRule objects
         """
-        rules = {}
-        
-        for rule_id, rule_config in config.items():
-            try:
-                # Skip disabled rules
-                if not rule_config.get('enabled', True):
-                    logger.debug(f"Skipped disabled rule: {rule_id}")
-                    continue
-                
-                # Validate required fields
-                required_fields = ['name', 'description', 'sql_query', 'level']
-                missing = [f for f in required_fields if f not in rule_config]
-                if missing:
-                    raise RuleProcessingError(
-                        f"Rule '{rule_id}' missing required fields: {missing}"
-                    )
-                
-                # Determine rule level
-                level_str = rule_config['level'].lower()
-                if level_str == 'npi':
-                    level = RuleLevel.NPI_LEVEL
-                elif level_str == 'specialty':
-                    level = RuleLevel.SPECIALTY_LEVEL
-                else:
-                    raise RuleProcessingError(
-                        f"Rule '{rule_id}' has invalid level: {level_str}"
-                    )
-                
-                # Create rule object
-                rule = SuppressionRule(
-                    rule_id=rule_id,
-                    name=rule_config['name'],
-                    description=rule_config['description'],
-                    sql_query=rule_config['sql_query'],
-                    level=level,
-                    enabled=rule_config.get('enabled', True)
+        return dict(_load_rules_cached(_RulesConfigKey(config)))
+
+
+class _RulesConfigKey:
+    """
+    Cache key for a rules configuration that keeps the original mapping.
+    
+    Equality and hashing use the configuration's JSON form, but rules are
+    always built from the original values, never from the serialized copy.
+    """
+    
+    __slots__ = ('config', '_serialized')
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        # Keys are not sorted: rule order drives master results column order.
+        # repr keeps non-JSON values (e.g. YAML dates) distinct from strings.
+        self._serialized = json.dumps(config, default=repr)
+    
+    def __hash__(self) -> int:
+        return hash(self._serialized)
+    
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _RulesConfigKey) and self._serialized == other._serialized
+
+
+@lru_cache(maxsize=32)
+def _load_rules_cached(config_key: _RulesConfigKey) -> Dict[str, SuppressionRule]:
+    """Builds and validates rules from a configuration, memoized on its contents."""
+    config = config_key.config
+    rules = {}
+    
+    for rule_id, rule_config in config.items():
+        try:
+            # Skip disabled rules
+            if not rule_config.get('enabled', True):
+                logger.debug("Skipped disabled rule: %s", rule_id)
+                continue
+            
+            # Validate required fields
+            required_fields = ['name', 'description', 'sql_query', 'level']
+            missing = [f for f in required_fields if f not in rule_config]
+            if missing:
+                raise RuleProcessingError(
+                    f"Rule '{rule_id}' missing required fields: {missing}"
                 )
+            
+            # Determine rule level
+            level_str = rule_config['level'].lower()
+            if level_str == 'npi':
+                level = RuleLevel.NPI_LEVEL
+            elif level_str == 'specialty':
+                level = RuleLevel.SPECIALTY_LEVEL
+            else:
+                raise RuleProcessingError(
+                    f"Rule '{rule_id}' has invalid level: {level_str}"
+                )
+            
+            # Create rule object
+            rule = SuppressionRule(
+                rule_id=rule_id,
+                name=rule_config['name'],
+                description=rule_config['description'],
+                sql_query=rule_config['sql_query'],
+                level=level,
+                enabled=rule_config.get('enabled', True),
+                results_unique=rule_config.get(
+                    'results_unique', _selects_distinct(rule_config['sql_query'])
+                )
+            )
+            
+            rules[rule_id] = rule
+            logger.debug("Loaded rule: %s (%s)", rule_id, rule.name)
                 
-                rules[rule_id] = rule
-                logger.debug(f"Loaded rule: {rule_id} ({rule.name})")
-                    
-            except Exception as e:
-                logger.error(f"Failed to load rule '{rule_id}': {str(e)}")
-                raise RuleProcessingError(f"Failed to load rule '{rule_id}': {str(e)}")
-        
-        logger.info(f"Loaded {len(rules)} suppression rules")
-        return rules
\ No newline at end of file
+        except Exception as e:
+            logger.error(f"Failed to load rule '{rule_id}': {str(e)}")
+            raise RuleProcessingError(f"Failed to load rule '{rule_id}': {str(e)}")
+    
+    logger.info(f"Loaded {len(rules)} suppression rules")
+    return rules
\ No newline at end of file
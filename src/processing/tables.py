@@ -1,10 +1,12 @@
 """Base classes and utilities for database table operations."""
 
+import threading
 import uuid
 from contextlib import contextmanager
 from typing import Set, Optional, List, Dict, Any
 import teradatasql
 
+from ..core.constants import DEFAULT_BATCH_SIZE
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -13,11 +15,38 @@ logger = get_logger(__name__)
 class TableManager:
     """Manages volatile table lifecycle."""
     
-    def __init__(self, connection: teradatasql.TeradataConnection):
+    def __init__(self, connection: teradatasql.TeradataConnection, collect_stats: bool = True):
         self.connection = connection
-        self.cursor = connection.cursor()
+        self.collect_stats = collect_stats
         self.session_id = str(uuid.uuid4()).replace('-', '')[:8]
         self.created_tables: Set[str] = set()
+        
+        # One reusable cursor per thread, tracked so cleanup can close them all
+        self._cursor_local = threading.local()
+        self._cursors: List[Any] = []
+        self._cursors_lock = threading.Lock()
+    
+    def get_cursor(self) -> Any:
+        """Returns the calling thread's cursor, opening it on first use."""
+        cursor = getattr(self._cursor_local, 'cursor', None)
+        if cursor is None:
+            cursor = self.connection.cursor()
+            self._cursor_local.cursor = cursor
+            with self._cursors_lock:
+                self._cursors.append(cursor)
+        return cursor
+    
+    def close_cursors(self) -> None:
+        """Close every cursor opened through get_cursor."""
+        with self._cursors_lock:
+            cursors, self._cursors = self._cursors, []
+            self._cursor_local = threading.local()
+        
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.warning(f"Failed to close cursor: {str(e)}")
     
     def create_volatile_table(
         self, 
@@ -51,27 +80,63 @@ class TableManager:
         create_sql += " ON COMMIT PRESERVE ROWS"
         
         try:
-            self.cursor.execute(create_sql)
+            self.get_cursor().execute(create_sql)
             self.created_tables.add(table_name)
-            logger.debug(f"Created volatile table: {table_name}")
+            logger.debug("Created volatile table: %s", table_name)
             return table_name
         except Exception as e:
             logger.error(f"Failed to create table {table_name}: {str(e)}")
             raise
     
+    def collect_statistics(self, table_name: str, stat_columns: List[str]) -> None:
+        """
+        Collect optimizer statistics on a freshly populated table.
+        
+        Failures are logged and ignored; statistics only improve query plans.
+        
+        Args:
+            table_name: Table to collect statistics on
+            stat_columns: Column groups, e.g. ['npi', 'npi,specialty_name']
+        """
+        if not self.collect_stats or not stat_columns:
+            return
+        
+        columns_sql = ", ".join(f"COLUMN ({cols})" for cols in stat_columns)
+        try:
+            self.get_cursor().execute(f"COLLECT STATISTICS {columns_sql} ON {table_name}")
+            logger.debug("Collected statistics on %s", table_name)
+        except Exception as e:
+            logger.warning(f"Failed to collect statistics on {table_name}: {str(e)}")
+    
     def drop_table(self, table_name: str) -> None:
         """Drop a single table."""
         try:
-            self.cursor.execute(f"DROP TABLE {table_name}")
+            self.get_cursor().execute(f"DROP TABLE {table_name}")
             self.created_tables.discard(table_name)
-            logger.debug(f"Dropped table: {table_name}")
+            logger.debug("Dropped table: %s", table_name)
         except Exception as e:
             logger.warning(f"Failed to drop table {table_name}: {str(e)}")
     
-    def cleanup_all_tables(self) -> None:
-        """Drop all created tables."""
-        for table_name in list(self.created_tables):
-            self.drop_table(table_name)
+    def cleanup_all_tables(self, drop_tables: bool = True) -> None:
+        """
+        Drop all created tables.
+        
+        Teradata does not allow more than one DDL statement per request, so
+        each drop is its own round trip. When the session is about to be
+        closed the drops can be skipped: volatile tables are released at
+        logoff.
+        
+        Args:
+            drop_tables: Issue DROP TABLE for each table; False only forgets them
+        """
+        if not drop_tables:
+            logger.debug("Leaving %d volatile tables to be released at logoff", len(self.created_tables))
+            self.created_tables.clear()
+        else:
+            for table_name in list(self.created_tables):
+                self.drop_table(table_name)
+        
+        self.close_cursors()
     
     @contextmanager
     def temporary_table(self, table_suffix: str, columns: List[Dict[str, str]], **kwargs):
@@ -83,6 +148,27 @@ class TableManager:
             self.drop_table(table_name)
 
 
+def inserted_row_count(cursor: Any, table_name: str) -> int:
+    """
+    Row count of the INSERT just executed on the cursor.
+    
+    teradatasql reports the activity count as cursor.rowcount; only if the
+    driver leaves it unset is the table counted with a query.
+    
+    Args:
+        cursor: Cursor that executed the INSERT
+        table_name: Table the rows were inserted into
+        
+    Returns:
+        Number of rows inserted
+    """
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        return cursor.rowcount
+    
+    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+    return cursor.fetchone()[0]
+
+
 class BatchProcessor:
     """Utilities for batch processing database operations."""
     
@@ -92,7 +178,7 @@ class BatchProcessor:
         table_name: str,
         columns: List[str],
         data: List[tuple],
-        batch_size: int = 10000
+        batch_size: int = DEFAULT_BATCH_SIZE
     ) -> int:
         """
         Insert data in batches with progress tracking.
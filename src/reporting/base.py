@@ -1,14 +1,107 @@
 """Base classes for report generation."""
 
 import csv
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import closing
 from pathlib import Path
-from typing import List, Dict, Any, Iterator, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
+from ..core.constants import (
+    REPORT_PREFETCH_CHUNK_ROWS,
+    REPORT_PREFETCH_DEPTH,
+    REPORT_PROGRESS_INTERVAL_SECONDS,
+    REPORT_WRITE_BUFFER_BYTES,
+)
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_END_OF_DATA = object()
+
+
+def _chunk_rows(data: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Group rows into lists of at most chunk_size rows."""
+    chunk = []
+    for row in data:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def prefetch_batches(
+    batches: Iterable[List[Any]],
+    depth: int = REPORT_PREFETCH_DEPTH
+) -> Iterator[List[Any]]:
+    """
+    Yield row batches pulled from batches by a background thread.
+    
+    Lets the next database fetch run while the caller is still writing the
+    previous batch. At most `depth` batches are buffered, and errors raised
+    while reading are re-raised in the caller.
+    
+    Args:
+        batches: Iterable of row lists, typically backed by a live cursor
+        depth: Maximum number of batches buffered ahead of the consumer
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    
+    def put(item: Any) -> bool:
+        # Poll so the producer exits if the consumer has stopped reading
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+            put(_END_OF_DATA)
+        except BaseException as e:
+            put(e)
+    
+    producer = threading.Thread(target=produce, name='report-prefetch', daemon=True)
+    producer.start()
+    
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END_OF_DATA:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def prefetch_chunks(
+    data: Iterable[Any],
+    chunk_size: int = REPORT_PREFETCH_CHUNK_ROWS,
+    depth: int = REPORT_PREFETCH_DEPTH
+) -> Iterator[List[Any]]:
+    """
+    Yield lists of rows pulled from data by a background thread.
+    
+    Args:
+        data: Row iterable, typically backed by a live cursor
+        chunk_size: Rows per yielded chunk
+        depth: Maximum number of chunks buffered ahead of the consumer
+    """
+    return prefetch_batches(_chunk_rows(data, chunk_size), depth)
+
 
 class BaseReportGenerator(ABC):
     """Base class for all report generators."""
@@ -41,20 +134,64 @@ class BaseReportGenerator(ABC):
         Returns:
             Path to the written file
         """
+        return self._write_csv_batches(filename, headers, prefetch_chunks(data), delimiter)
+    
+    def write_csv_report_batched(
+        self, 
+        filename: str, 
+        headers: List[str], 
+        batches: Iterator[List[Any]],
+        delimiter: str = ','
+    ) -> Path:
+        """
+        Write CSV report from row batches, e.g. cursor fetchmany() results.
+        
+        Each batch goes to csv.writer.writerows as is, without being split
+        into rows and regrouped.
+        
+        Args:
+            filename: Name of the output file
+            headers: List of column headers
+            batches: Iterator of row lists to write
+            delimiter: CSV delimiter
+            
+        Returns:
+            Path to the written file
+        """
+        return self._write_csv_batches(filename, headers, prefetch_batches(batches), delimiter)
+    
+    def _write_csv_batches(
+        self, 
+        filename: str, 
+        headers: List[str], 
+        batches: Iterator[List[Any]],
+        delimiter: str
+    ) -> Path:
+        """Write headers and row batches to a CSV file, closing the batches before returning."""
         output_path = self.output_dir / filename
         row_count = 0
         
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            with open(output_path, 'w', newline='', encoding='utf-8',
+                      buffering=REPORT_WRITE_BUFFER_BYTES) as f:
                 writer = csv.writer(f, delimiter=delimiter)
                 writer.writerow(headers)
                 
-                for row in data:
-                    writer.writerow(row)
-                    row_count += 1
-                    
-                    if row_count % 100000 == 0:
-                        logger.debug(f"Written {row_count:,} rows to {filename}")
+                # Fetching runs in a background thread so it overlaps the writes.
+                # Closing the batches stops and joins that thread, so it is no
+                # longer reading the caller's cursor once this method returns,
+                # including when a write fails.
+                # Progress is time based and checked once per batch, not per row.
+                with closing(batches):
+                    next_progress_at = time.monotonic() + REPORT_PROGRESS_INTERVAL_SECONDS
+                    for batch in batches:
+                        writer.writerows(batch)
+                        row_count += len(batch)
+                        
+                        now = time.monotonic()
+                        if now >= next_progress_at:
+                            next_progress_at = now + REPORT_PROGRESS_INTERVAL_SECONDS
+                            logger.debug(f"Written {row_count:,} rows to {filename}")
             
             logger.info(f"Report generated: {filename} ({row_count:,} rows)")
             return output_path
@@ -2,12 +2,14 @@
 Report generation modules for NPI suppression analysis.
 """
 
+from contextlib import closing, contextmanager
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict, Iterator, List, Optional
 from pathlib import Path
 
 from .base import BaseReportGenerator
 from .metrics import ProcessingMetrics, MetricsFormatter
+from ..core.connections import iter_batches
 from ..core.constants import REPORT_FILES
 from ..core.exceptions import ReportGenerationError
 from ..utils.logging_config import get_logger
@@ -15,52 +17,69 @@ from ..utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-class MasterTableReportGenerator(BaseReportGenerator):
-    """Generates comprehensive master table reports with all rule results."""
+class RuleEngineReportGenerator(BaseReportGenerator):
+    """Base class for reports that query the rule engine's result tables."""
     
     def __init__(self, rule_engine, output_dir: Path):
         super().__init__(output_dir)
         self.rule_engine = rule_engine
         self.connection = rule_engine.connection
-        self.cursor = rule_engine.connection.cursor()
     
-    def generate(self) -> Path:
-        """Generate master suppression results report."""
-        logger.info("Generating master suppression results report")
+    @contextmanager
+    def _cursor(self) -> Iterator[Any]:
+        """Yields a cursor sized for report fetches and closes it afterwards."""
+        cursor = self.connection.cursor()
+        cursor.arraysize = self.rule_engine.fetch_arraysize
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    
+    def _write_query_report(
+        self,
+        filename: str,
+        query: str,
+        headers: Optional[List[str]] = None
+    ) -> Path:
+        """
+        Runs a query on a short-lived cursor and writes its rows as a CSV report.
         
-        # Get column names dynamically
-        column_query = f"SELECT * FROM {self.rule_engine.master_results_table} SAMPLE 1"
-        self.cursor.execute(column_query)
-        columns = [desc[0] for desc in self.cursor.description]
+        The batch stream over the cursor is closed, after the writer has joined
+        its prefetch thread, before the cursor itself is closed.
         
-        # Generate data rows
-        def data_generator():
-            query = f"SELECT * FROM {self.rule_engine.master_results_table} ORDER BY npi, specialty_name"
-            self.cursor.execute(query)
+        Args:
+            filename: Name of the output file
+            query: SQL whose result rows are written
+            headers: Column headers; taken from the query's description if omitted
+            
+        Returns:
+            Path to the written file
+        """
+        with self._cursor() as cursor:
+            cursor.execute(query)
+            if headers is None:
+                headers = [desc[0] for desc in cursor.description]
             
-            while True:
-                rows = self.cursor.fetchmany(self.rule_engine.batch_size)
-                if not rows:
-                    break
-                for row in rows:
-                    yield row
+            with closing(iter_batches(cursor, cursor.arraysize)) as batches:
+                return self.write_csv_report_batched(filename, headers, batches)
+
+
+class MasterTableReportGenerator(RuleEngineReportGenerator):
+    """Generates comprehensive master table reports with all rule results."""
+    
+    def generate(self) -> Path:
+        """Generate master suppression results report."""
+        logger.info("Generating master suppression results report")
         
-        return self.write_csv_report(
-            REPORT_FILES['master'],
-            columns,
-            data_generator()
-        )
+        # Column names come from the data query's own description, so no
+        # separate query is needed just to read them
+        query = f"SELECT * FROM {self.rule_engine.master_results_table} ORDER BY npi, specialty_name"
+        return self._write_query_report(REPORT_FILES['master'], query)
 
 
-class RuleImpactReportGenerator(BaseReportGenerator):
+class RuleImpactReportGenerator(RuleEngineReportGenerator):
     """Generates rule-level impact analysis reports."""
     
-    def __init__(self, rule_engine, output_dir: Path):
-        super().__init__(output_dir)
-        self.rule_engine = rule_engine
-        self.connection = rule_engine.connection
-        self.cursor = rule_engine.connection.cursor()
-    
     def generate(self) -> Path:
         """Generate rule impact analysis report."""
         logger.info("Generating rule impact analysis report")
@@ -70,25 +89,18 @@ class RuleImpactReportGenerator(BaseReportGenerator):
             'combinations_matched', 'execution_time_seconds', 'status'
         ]
         
+        npi_counts = self._count_npis_by_rule()
+        
         def data_generator():
             for rule_id, rule in self.rule_engine.rules.items():
                 result = self.rule_engine.rule_execution_results.get(rule_id)
                 
                 if result:
-                    # Get NPI count for this rule
-                    npi_query = f"""
-                    SELECT COUNT(DISTINCT npi) 
-                    FROM {self.rule_engine.master_results_table}
-                    WHERE rule_{rule_id}_flag = 'Y'
-                    """
-                    self.cursor.execute(npi_query)
-                    npi_count = self.cursor.fetchone()[0]
-                    
                     yield [
                         rule_id,
                         rule.name,
                         rule.level.value,
-                        npi_count,
+                        npi_counts.get(rule_id, 0),
                         result.records_matched,
                         round(result.execution_time_seconds, 2),
                         'Success' if result.success else f'Failed: {result.error_message}'
@@ -99,17 +111,31 @@ class RuleImpactReportGenerator(BaseReportGenerator):
             headers,
             data_generator()
         )
+    
+    def _count_npis_by_rule(self) -> Dict[str, int]:
+        """
+        Counts NPIs flagged by each successful rule in one query.
+        
+        Reads the engine's per-NPI summary, where each rule flag is already
+        reduced to one value per NPI. Failed rules have no flag column and
+        are left out.
+        """
+        rule_ids = self.rule_engine.master_rule_ids
+        if not rule_ids:
+            return {}
+        
+        npi_counts = ", ".join(
+            f"SUM(CASE WHEN rule_{rule_id}_flag = 'Y' THEN 1 ELSE 0 END)" for rule_id in rule_ids
+        )
+        with self._cursor() as cursor:
+            cursor.execute(f"SELECT {npi_counts} FROM {self.rule_engine.npi_summary_table}")
+            row = cursor.fetchone()
+        return {rule_id: count or 0 for rule_id, count in zip(rule_ids, row)}
 
 
-class RuleCombinationReportGenerator(BaseReportGenerator):
+class RuleCombinationReportGenerator(RuleEngineReportGenerator):
     """Generates rule combination analysis reports."""
     
-    def __init__(self, rule_engine, output_dir: Path):
-        super().__init__(output_dir)
-        self.rule_engine = rule_engine
-        self.connection = rule_engine.connection
-        self.cursor = rule_engine.connection.cursor()
-    
     def generate(self) -> Path:
         """Generate rule combination analysis report."""
         logger.info("Generating rule combination analysis report")
@@ -128,62 +154,32 @@ class RuleCombinationReportGenerator(BaseReportGenerator):
         
         headers = ['rule_combination', 'total_occurrences', 'unique_npis', 'suppression_flag']
         
-        def data_generator():
-            self.cursor.execute(query)
-            while True:
-                rows = self.cursor.fetchmany(1000)
-                if not rows:
-                    break
-                for row in rows:
-                    yield row
-        
-        return self.write_csv_report(
-            REPORT_FILES['combination'],
-            headers,
-            data_generator()
-        )
+        return self._write_query_report(REPORT_FILES['combination'], query, headers)
 
 
-class DatabaseImpactReportGenerator(BaseReportGenerator):
+class DatabaseImpactReportGenerator(RuleEngineReportGenerator):
     """Generates database impact analysis reports."""
     
-    def __init__(self, rule_engine, output_dir: Path):
-        super().__init__(output_dir)
-        self.rule_engine = rule_engine
-        self.connection = rule_engine.connection
-        self.cursor = rule_engine.connection.cursor()
-    
     def generate(self) -> Path:
         """Generate database impact report."""
         logger.info("Generating database impact report")
         
         headers = ['entity_type', 'entity_id', 'entity_name', 'suppression_action']
         
-        def data_generator():
-            # Practitioners to suppress (simplified without prov_prac_xref_sk)
-            query = f"""
-            SELECT DISTINCT 
-                'Practitioner' as entity_type,
-                m.npi as entity_id,
-                'NPI_' || m.npi as entity_name,
-                'Suppress' as action
-            FROM {self.rule_engine.master_results_table} m
-            WHERE m.suppression_flag = 'Y'
-            """
-            
-            self.cursor.execute(query)
-            while True:
-                rows = self.cursor.fetchmany(1000)
-                if not rows:
-                    break
-                for row in rows:
-                    yield row
+        # Practitioners to suppress (simplified without prov_prac_xref_sk).
+        # The per-NPI summary already has one row per NPI, so no DISTINCT
+        # over master results is needed.
+        query = f"""
+        SELECT 
+            'Practitioner' as entity_type,
+            s.npi as entity_id,
+            'NPI_' || s.npi as entity_name,
+            'Suppress' as action
+        FROM {self.rule_engine.npi_summary_table} s
+        WHERE s.suppressed_combinations > 0
+        """
         
-        return self.write_csv_report(
-            REPORT_FILES['database'],
-            headers,
-            data_generator()
-        )
+        return self._write_query_report(REPORT_FILES['database'], query, headers)
 
 
 class SummaryReportGenerator(BaseReportGenerator):
@@ -200,11 +196,16 @@ class SummaryReportGenerator(BaseReportGenerator):
         
         # Gather execution details
         execution_summary = self._generate_execution_summary()
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        total_rules = len(self.rule_engine.rules)
+        successful_rules = len([
+            result for result in self.rule_engine.rule_execution_results.values() if result.success
+        ])
         
         # Format complete report
         report_content = f"""
 NPI Provider Suppression Processing Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated: {generated_at}
 {'=' * 70}
 
 {MetricsFormatter.format_summary_report(self.processing_metrics)}
@@ -217,8 +218,8 @@ PROCESSING DETAILS
 {'=' * 70}
 Session ID: {self.rule_engine.session_id}
 Batch Size: {self.rule_engine.batch_size:,}
-Total Rules Loaded: {len(self.rule_engine.rules)}
-Rules Successfully Executed: {sum(1 for r in self.rule_engine.rule_execution_results.values() if r.success)}
+Total Rules Loaded: {total_rules}
+Rules Successfully Executed: {successful_rules}
 
 GENERATED REPORTS
 {'=' * 70}
@@ -236,18 +237,20 @@ End of Report
     
     def _generate_execution_summary(self) -> str:
         """Generate rule execution summary."""
-        lines = []
+        results = self.rule_engine.rule_execution_results
+        line_template = "{} {}: {} - {:,} matches in {:.2f}s".format
         
-        for rule_id, rule in self.rule_engine.rules.items():
-            result = self.rule_engine.rule_execution_results.get(rule_id)
-            if result:
-                status = "✓" if result.success else "✗"
-                lines.append(
-                    f"{status} {rule_id}: {rule.name} - "
-                    f"{result.records_matched:,} matches in {result.execution_time_seconds:.2f}s"
-                )
-        
-        return "\n".join(lines)
+        return "\n".join(
+            line_template(
+                "✓" if results[rule_id].success else "✗",
+                rule_id,
+                rule.name,
+                results[rule_id].records_matched,
+                results[rule_id].execution_time_seconds
+            )
+            for rule_id, rule in self.rule_engine.rules.items()
+            if rule_id in results
+        )
 
 
 class ReportOrchestrator:
@@ -256,7 +259,7 @@ class ReportOrchestrator:
     def __init__(self, rule_engine):
         self.rule_engine = rule_engine
     
-    def generate_all_reports(self, output_directory: str, batch_size: int) -> Dict[str, str]:
+    def generate_all_reports(self, output_directory: str, batch_size: int) -> Dict[str, Path]:
         """
         Generate all analysis reports.
         
@@ -283,8 +286,7 @@ class ReportOrchestrator:
             
             for report_type, generator in generators:
                 try:
-                    path = generator.generate()
-                    report_paths[report_type] = str(path)
+                    report_paths[report_type] = generator.generate()
                 except Exception as e:
                     logger.error(f"Failed to generate {report_type} report: {str(e)}")
             
@@ -305,7 +307,7 @@ class ReportOrchestrator:
                 )
                 
                 summary_gen = SummaryReportGenerator(self.rule_engine, metrics, output_dir)
-                report_paths['summary'] = str(summary_gen.generate())
+                report_paths['summary'] = summary_gen.generate()
             
             return report_paths
             
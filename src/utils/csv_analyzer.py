@@ -26,8 +26,10 @@ def analyze_csv_universe(csv_path: str, npi_column: str = 'npi') -> Dict[str, An
     logger.info(f"Analyzing CSV universe: {csv_path}")
     
     try:
-        # Read CSV file
-        df = pd.read_csv(csv_path, dtype=str)
+        # Read CSV file; only the NPI column is parsed
+        df = pd.read_csv(
+            csv_path, dtype=str, engine='c', usecols=lambda column: column == npi_column
+        )
         
         if npi_column not in df.columns:
             raise ValueError(f"Column '{npi_column}' not found in CSV")
@@ -35,16 +37,10 @@ def analyze_csv_universe(csv_path: str, npi_column: str = 'npi') -> Dict[str, An
         logger.info(f"CSV loaded: {len(df):,} rows")
         
         # Validate NPIs
-        validator = NPIValidator()
-        valid_npis = set()
-        invalid_count = 0
-        
-        for npi in df[npi_column]:
-            clean_npi = validator.validate_and_clean(npi)
-            if clean_npi:
-                valid_npis.add(clean_npi)
-            else:
-                invalid_count += 1
+        clean_npis = NPIValidator.clean_series(df[npi_column])
+        valid_mask = clean_npis.notna()
+        valid_npis = set(clean_npis[valid_mask].unique())
+        invalid_count = int((~valid_mask).sum())
         
         # Create metrics
         metrics = ProcessingMetrics(
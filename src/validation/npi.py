@@ -8,6 +8,11 @@ from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Deletes every non-digit Latin-1 character in a single str.translate pass
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(256) if not chr(code).isdigit()
+))
+
 
 class NPIValidator:
     """Validates and cleans NPI values according to CMS standards."""
@@ -23,14 +28,17 @@ class NPIValidator:
         Returns:
             Clean 10-digit NPI string if valid, None if invalid
         """
-        if pd.isna(npi_value) or npi_value is None:
+        # NaN is the only value not equal to itself; cheaper than pd.isna per row.
+        # Other missing markers (pd.NA, NaT) stringify without digits and fail below.
+        if npi_value is None or (isinstance(npi_value, float) and npi_value != npi_value):
             return None
         
-        # Convert to string and remove whitespace
-        clean_npi = str(npi_value).strip()
-        
-        # Extract only digits
-        clean_npi = ''.join(char for char in clean_npi if char.isdigit())
+        # Extract only digits (whitespace included in the deleted characters)
+        text = npi_value if isinstance(npi_value, str) else str(npi_value)
+        clean_npi = text.translate(_NON_DIGIT_TABLE)
+        if not clean_npi.isascii():
+            # Characters beyond Latin-1 are not in the table; filter them per character
+            clean_npi = ''.join(char for char in clean_npi if char.isdigit())
         
         # Validate NPI format (must be exactly 10 digits)
         if len(clean_npi) == NPI_LENGTH and clean_npi.isdigit():
@@ -38,6 +46,22 @@ class NPIValidator:
         
         return None
     
+    @staticmethod
+    def clean_series(npi_values: pd.Series) -> pd.Series:
+        """
+        Vectorized validate_and_clean for a whole column of NPI values.
+        
+        Args:
+            npi_values: Raw NPI values, e.g. a CSV column read with dtype=str
+            
+        Returns:
+            Series aligned with the input holding clean 10-digit NPI strings,
+            with NaN where the value is invalid
+        """
+        # Missing values become 'nan' here and fail the length check
+        digits = npi_values.astype(str).str.replace(r'\D', '', regex=True)
+        return digits.where(digits.str.len() == NPI_LENGTH)
+    
     @staticmethod
     def validate_checksum(npi: str) -> bool:
         """
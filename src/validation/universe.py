@@ -5,23 +5,45 @@ Handles loading, validation, and provider type categorization of NPI universe da
 Supports both CSV and Teradata table sources with comprehensive provider type analysis.
 """
 
+import codecs
 import csv
+import logging
 import uuid
-from typing import Dict, Set, Optional, Tuple
-from dataclasses import dataclass
+from itertools import islice
+from typing import Set, Optional, Tuple
+from dataclasses import dataclass, field
 import teradatasql
 import pandas as pd
 
 from .npi import NPIValidator
-from ..core.constants import ProviderType
+from ..core.connections import iter_rows
+from ..core.constants import ProviderType, REPORT_WRITE_BUFFER_BYTES
 from ..core.exceptions import UniverseValidationError, ValidationError
-from ..processing.tables import TableManager
+from ..processing.tables import TableManager, inserted_row_count
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Byte order marks that fix a CSV's encoding without trial decoding
+_CSV_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
 
-@dataclass
+# Distinct NPIs of the practitioner reference source
+_PRACTITIONER_NPIS_SQL = """
+            SELECT DISTINCT nationalproviderid
+            FROM providerdataservice_core_v.prov_spayer_practitioners
+        """
+
+
+def _rounded_percentage(part: int, whole: int) -> float:
+    """Percentage of part in whole to two decimals, 0.0 when whole is empty."""
+    return round(part / whole * 100, 2) if whole > 0 else 0.0
+
+
+@dataclass(frozen=True)
 class ProviderTypeCounts:
     """Container for provider type counts and percentages."""
     practitioners: int
@@ -30,30 +52,29 @@ class ProviderTypeCounts:
     uncategorized: int
     total: int
     
-    @property
-    def practitioner_percentage(self) -> float:
-        return round(self.practitioners / self.total * 100, 2) if self.total > 0 else 0.0
-    
-    @property
-    def facility_percentage(self) -> float:
-        return round(self.facilities / self.total * 100, 2) if self.total > 0 else 0.0
-    
-    @property
-    def ancillary_percentage(self) -> float:
-        return round(self.ancillary / self.total * 100, 2) if self.total > 0 else 0.0
+    # Count of NPIs that will be suppressed by provider type rule
+    non_practitioner_count: int = field(init=False)
     
-    @property
-    def uncategorized_percentage(self) -> float:
-        return round(self.uncategorized / self.total * 100, 2) if self.total > 0 else 0.0
+    # Percentages of total, computed once from the counts above
+    practitioner_percentage: float = field(init=False)
+    facility_percentage: float = field(init=False)
+    ancillary_percentage: float = field(init=False)
+    uncategorized_percentage: float = field(init=False)
+    non_practitioner_percentage: float = field(init=False)
     
-    @property
-    def non_practitioner_count(self) -> int:
-        """Count of NPIs that will be suppressed by provider type rule."""
-        return self.facilities + self.ancillary + self.uncategorized
-    
-    @property
-    def non_practitioner_percentage(self) -> float:
-        return round(self.non_practitioner_count / self.total * 100, 2) if self.total > 0 else 0.0
+    def __post_init__(self):
+        non_practitioner_count = self.facilities + self.ancillary + self.uncategorized
+        object.__setattr__(self, 'non_practitioner_count', non_practitioner_count)
+        object.__setattr__(self, 'practitioner_percentage',
+                           _rounded_percentage(self.practitioners, self.total))
+        object.__setattr__(self, 'facility_percentage',
+                           _rounded_percentage(self.facilities, self.total))
+        object.__setattr__(self, 'ancillary_percentage',
+                           _rounded_percentage(self.ancillary, self.total))
+        object.__setattr__(self, 'uncategorized_percentage',
+                           _rounded_percentage(self.uncategorized, self.total))
+        object.__setattr__(self, 'non_practitioner_percentage',
+                           _rounded_percentage(non_practitioner_count, self.total))
 
 
 @dataclass
@@ -68,7 +89,31 @@ class UniverseValidationResults:
     ancillary_npis: Set[str]
     uncategorized_npis: Set[str]
     provider_type_counts: ProviderTypeCounts
-    npi_to_provider_type_map: Dict[str, str]
+    # False when the universe table's npi column is numeric rather than text
+    npi_is_text: bool = True
+    
+    def provider_type_of(self, npi: str) -> str:
+        """
+        Looks up the provider type of a universe NPI in the category sets.
+        
+        The sets can overlap; ancillary takes precedence over facility, and
+        facility over practitioner.
+        
+        Args:
+            npi: NPI to lookup
+            
+        Returns:
+            Provider type, or UNKNOWN for NPIs outside the universe
+        """
+        if npi in self.uncategorized_npis:
+            return ProviderType.UNCATEGORIZED
+        if npi in self.ancillary_npis:
+            return ProviderType.ANCILLARY
+        if npi in self.facility_npis:
+            return ProviderType.FACILITY
+        if npi in self.practitioner_npis:
+            return ProviderType.PRACTITIONER
+        return ProviderType.UNKNOWN
 
 
 class UniverseLoader:
@@ -98,13 +143,10 @@ class UniverseLoader:
         table_name = self.table_manager.create_volatile_table('universe', columns, primary_index='npi')
         
         try:
-            # Read CSV with multiple encoding attempts
-            df = self._read_csv_with_encoding_fallback(csv_path)
-            
-            if npi_column not in df.columns:
-                raise ValidationError(f"Column '{npi_column}' not found. Available: {list(df.columns)}")
+            # Read the NPI column with multiple encoding attempts
+            df = self._read_csv_with_encoding_fallback(csv_path, npi_column)
             
-            logger.info(f"CSV loaded: {len(df):,} rows, columns: {list(df.columns)}")
+            logger.info(f"CSV loaded: {len(df):,} rows, column: {npi_column}")
             
             # Process and validate NPIs
             valid_npis = self._extract_valid_npis(df[npi_column])
@@ -112,18 +154,22 @@ class UniverseLoader:
             if not valid_npis:
                 raise ValidationError("No valid NPIs found in CSV file")
             
-            # Load NPIs into Teradata table
-            npi_data = [(npi,) for npi in valid_npis]
-            logger.info(f"Inserting {len(npi_data):,} NPIs into table {table_name}...")
+            # Load NPIs into Teradata table, building parameter tuples one
+            # chunk at a time rather than as a second full-size list
+            npi_rows = ((npi,) for npi in valid_npis)
+            total_count = len(valid_npis)
+            logger.info(f"Inserting {total_count:,} NPIs into table {table_name}...")
             
             # Insert in chunks of 50000 to avoid transaction size issues
             chunk_size = 50000
             loaded_count = 0
+            insert_sql = f"INSERT INTO {table_name} (npi) VALUES (?)"
             
-            for i in range(0, len(npi_data), chunk_size):
-                chunk = npi_data[i:i + chunk_size]
+            while True:
+                chunk = list(islice(npi_rows, chunk_size))
+                if not chunk:
+                    break
                 try:
-                    insert_sql = f"INSERT INTO {table_name} (npi) VALUES (?)"
                     self.cursor.executemany(insert_sql, chunk)
                     loaded_count += len(chunk)
                     
@@ -131,9 +177,9 @@ class UniverseLoader:
                     self.connection.commit()
                     
                     if loaded_count % 100000 == 0:
-                        logger.info(f"Progress: {loaded_count:,}/{len(npi_data):,} NPIs inserted")
+                        logger.info(f"Progress: {loaded_count:,}/{total_count:,} NPIs inserted")
                 except Exception as e:
-                    logger.error(f"Error inserting chunk at position {i}: {str(e)}")
+                    logger.error(f"Error inserting chunk at position {loaded_count}: {str(e)}")
                     raise
             
             logger.info(f"Successfully inserted {loaded_count:,} NPIs")
@@ -169,15 +215,41 @@ class UniverseLoader:
             logger.error(f"Error validating Teradata table {table_name}: {str(e)}")
             raise
     
-    def _read_csv_with_encoding_fallback(self, csv_path: str) -> pd.DataFrame:
-        """Attempts to read CSV with multiple encoding options."""
-        for encoding in ['utf-8', 'latin1', 'cp1252']:
+    def _read_csv_with_encoding_fallback(self, csv_path: str, npi_column: str) -> pd.DataFrame:
+        """
+        Reads the NPI column of a CSV, picking the encoding from its BOM if any.
+        
+        Raises:
+            ValidationError: If no encoding can decode the file, or the NPI
+                column is missing (the error lists the available columns)
+        """
+        with open(csv_path, 'rb') as f:
+            head = f.read(len(codecs.BOM_UTF8))
+        
+        # Without a BOM, fall back from utf-8 to latin1, which decodes any byte
+        encodings = ['utf-8', 'latin1']
+        for bom, encoding in _CSV_BOM_ENCODINGS:
+            if head.startswith(bom):
+                encodings = [encoding]
+                break
+        
+        for encoding in encodings:
             try:
-                df = pd.read_csv(csv_path, dtype=str, encoding=encoding)
-                logger.debug(f"Successfully read CSV with {encoding} encoding")
-                return df
+                # Only the NPI column is parsed; other columns are skipped by the C reader
+                df = pd.read_csv(
+                    csv_path, dtype=str, encoding=encoding, engine='c',
+                    usecols=lambda column: column == npi_column
+                )
             except UnicodeDecodeError:
                 continue
+            
+            if npi_column not in df.columns:
+                # Only the header is read again, with the encoding that worked
+                available = list(pd.read_csv(csv_path, dtype=str, encoding=encoding, nrows=0).columns)
+                raise ValidationError(f"Column '{npi_column}' not found. Available: {available}")
+            
+            logger.debug("Successfully read CSV with %s encoding", encoding)
+            return df
         
         raise ValidationError("Could not read CSV file with any supported encoding")
     
@@ -185,20 +257,14 @@ class UniverseLoader:
         """Extracts and validates NPIs from pandas Series."""
         logger.info("Validating and deduplicating NPIs...")
         
-        valid_npis = set()
-        invalid_count = 0
+        clean_npis = self.npi_validator.clean_series(npi_series)
+        valid_mask = clean_npis.notna()
+        valid_npis = set(clean_npis[valid_mask].unique())
+        invalid_count = int((~valid_mask).sum())
         
-        for idx, npi_value in enumerate(npi_series):
-            if idx % 50000 == 0 and idx > 0:
-                logger.debug(f"Processed {idx:,} NPIs...")
-            
-            clean_npi = self.npi_validator.validate_and_clean(npi_value)
-            if clean_npi:
-                valid_npis.add(clean_npi)
-            else:
-                invalid_count += 1
-                if invalid_count <= 10:
-                    logger.warning(f"Invalid NPI at row {idx}: '{npi_value}'")
+        # Report the first few invalid values by row position
+        for idx in (~valid_mask).to_numpy().nonzero()[0][:10]:
+            logger.warning(f"Invalid NPI at row {idx}: '{npi_series.iloc[idx]}'")
         
         total_processed = len(npi_series)
         duplicates_removed = total_processed - invalid_count - len(valid_npis)
@@ -230,29 +296,33 @@ class ProviderTypeCategorizer:
         """
         logger.info("Starting provider type categorization...")
         
-        # Get total NPI count
-        total_npis = self._get_total_npi_count(universe_table)
-        
-        # Categorize by provider type
-        practitioner_npis = self._find_practitioner_npis(universe_table)
-        facility_npis = self._find_facility_npis(universe_table)
-        ancillary_npis = self._find_ancillary_npis(universe_table, practitioner_npis)
-        
-        # Remaining NPIs are uncategorized
-        all_npis = self._get_all_universe_npis(universe_table)
-        categorized_npis = practitioner_npis | facility_npis | ancillary_npis
-        uncategorized_npis = all_npis - categorized_npis
-        
-        # Create provider type mapping
-        npi_to_type_map = {}
-        for npi in practitioner_npis:
-            npi_to_type_map[npi] = ProviderType.PRACTITIONER
-        for npi in facility_npis:
-            npi_to_type_map[npi] = ProviderType.FACILITY
-        for npi in ancillary_npis:
-            npi_to_type_map[npi] = ProviderType.ANCILLARY
-        for npi in uncategorized_npis:
-            npi_to_type_map[npi] = ProviderType.UNCATEGORIZED
+        practitioner_npis: Set[str] = set()
+        facility_npis: Set[str] = set()
+        ancillary_npis: Set[str] = set()
+        uncategorized_npis: Set[str] = set()
+        total_npis = 0
+        
+        # One round-trip flags every universe NPI against all reference sources
+        # Rows are streamed in fetchmany() batches rather than fetched all at once
+        self.cursor.execute(self._categorization_query(universe_table))
+        # teradatasql reports the Python type of each column; text NPIs are
+        # used as returned and only other types are converted per row
+        npi_is_text = self.cursor.description[0][1] is str
+        for npi, is_practitioner, is_facility, is_practice_location in iter_rows(self.cursor):
+            if npi is not None:
+                total_npis += 1
+            if npi is None or not npi_is_text:
+                npi = str(npi)
+            
+            if is_practitioner:
+                practitioner_npis.add(npi)
+            if is_facility:
+                facility_npis.add(npi)
+            # Ancillary NPIs are those in practice locations but not practitioners
+            if is_practice_location and not is_practitioner:
+                ancillary_npis.add(npi)
+            if not (is_practitioner or is_facility or is_practice_location):
+                uncategorized_npis.add(npi)
         
         # Create counts object
         counts = ProviderTypeCounts(
@@ -275,88 +345,72 @@ class ProviderTypeCategorizer:
             ancillary_npis=ancillary_npis,
             uncategorized_npis=uncategorized_npis,
             provider_type_counts=counts,
-            npi_to_provider_type_map=npi_to_type_map
+            npi_is_text=npi_is_text
         )
     
-    def _get_total_npi_count(self, universe_table: str) -> int:
-        """Gets total count of unique NPIs in universe table."""
-        self.cursor.execute(f"SELECT COUNT(DISTINCT npi) FROM {universe_table}")
-        return self.cursor.fetchone()[0]
-    
-    def _find_practitioner_npis(self, universe_table: str) -> Set[str]:
-        """Finds NPIs that exist in the practitioners table."""
-        logger.info("Identifying practitioner NPIs...")
-        
-        query = f"""
-        SELECT DISTINCT u.npi
-        FROM {universe_table} u
-        INNER JOIN providerdataservice_core_v.prov_spayer_practitioners p 
-            ON u.npi = p.nationalproviderid
+    def _categorization_query(self, universe_table: str) -> str:
         """
+        Builds the query that flags each distinct universe NPI by source.
         
-        self.cursor.execute(query)
-        npis = {str(row[0]) for row in self.cursor.fetchall()}
+        Each reference source is reduced to distinct NPIs and LEFT JOINed
+        once, so Teradata does the membership tests and returns one row per
+        NPI with a 0/1 flag per source. Facilities and practice locations
+        only need one address or practice to exist, so those are EXISTS
+        tests rather than joins that repeat rows per address.
         
-        logger.info(f"Found {len(npis):,} practitioner NPIs")
-        return npis
-    
-    def _find_facility_npis(self, universe_table: str) -> Set[str]:
-        """Finds NPIs that exist in the facilities table."""
-        logger.info("Identifying facility NPIs...")
-        
-        query = f"""
-        SELECT DISTINCT u.npi
-        FROM {universe_table} u
-        INNER JOIN providerdataservice_core_v.PROV_SPAYER_Facilities f 
-            ON u.npi = f.nationalproviderid
-        INNER JOIN providerdataservice_core_v.PROV_SPAYER_Facilityaddresses fa 
-            ON f.FacilityID = fa.FacilityID
+        Args:
+            universe_table: Name of table containing universe NPIs
+            
+        Returns:
+            SQL selecting (npi, is_practitioner, is_facility, is_practice_location)
         """
-        
-        self.cursor.execute(query)
-        npis = {str(row[0]) for row in self.cursor.fetchall()}
-        
-        logger.info(f"Found {len(npis):,} facility NPIs")
-        return npis
-    
-    def _find_ancillary_npis(self, universe_table: str, practitioner_npis: Set[str]) -> Set[str]:
-        """Finds NPIs in practice locations but not in practitioners table."""
-        logger.info("Identifying ancillary NPIs...")
-        
-        query = f"""
-        SELECT DISTINCT u.npi
-        FROM {universe_table} u
-        INNER JOIN providerdataservice_core_v.prov_spayer_practicelocations pl
+        return f"""
+        SELECT 
+            u.npi,
+            CASE WHEN p.nationalproviderid IS NULL THEN 0 ELSE 1 END AS is_practitioner,
+            CASE WHEN f.nationalproviderid IS NULL THEN 0 ELSE 1 END AS is_facility,
+            CASE WHEN pl.nationalproviderid IS NULL THEN 0 ELSE 1 END AS is_practice_location
+        FROM (SELECT DISTINCT npi FROM {universe_table}) u
+        LEFT JOIN ({_PRACTITIONER_NPIS_SQL}) p
+            ON u.npi = p.nationalproviderid
+        LEFT JOIN (
+            SELECT DISTINCT f.nationalproviderid
+            FROM providerdataservice_core_v.PROV_SPAYER_Facilities f 
+            WHERE EXISTS (
+                SELECT 1
+                FROM providerdataservice_core_v.PROV_SPAYER_Facilityaddresses fa 
+                WHERE fa.FacilityID = f.FacilityID
+            )
+        ) f
+            ON u.npi = f.nationalproviderid
+        LEFT JOIN (
+            SELECT DISTINCT pl.nationalproviderid
+            FROM providerdataservice_core_v.prov_spayer_practicelocations pl
+            WHERE EXISTS (
+                SELECT 1
+                FROM providerdataservice_core_v.prov_spayer_practices pr 
+                WHERE pr.practiceid = pl.practiceid
+            )
+        ) pl
             ON u.npi = pl.nationalproviderid
-        INNER JOIN providerdataservice_core_v.prov_spayer_practices p 
-            ON pl.practiceid = p.practiceid
         """
-        
-        self.cursor.execute(query)
-        practice_location_npis = {str(row[0]) for row in self.cursor.fetchall()}
-        
-        # Ancillary NPIs are those in practice locations but not practitioners
-        ancillary_npis = practice_location_npis - practitioner_npis
-        
-        logger.info(f"Found {len(ancillary_npis):,} ancillary NPIs")
-        return ancillary_npis
-    
-    def _get_all_universe_npis(self, universe_table: str) -> Set[str]:
-        """Gets all NPIs from universe table."""
-        self.cursor.execute(f"SELECT DISTINCT npi FROM {universe_table}")
-        return {str(row[0]) for row in self.cursor.fetchall()}
     
     def _log_categorization_results(self, counts: ProviderTypeCounts) -> None:
         """Logs comprehensive categorization results."""
-        logger.info("Provider type categorization complete:")
-        logger.info(f"  Practitioners: {counts.practitioners:,} ({counts.practitioner_percentage:.1f}%)")
-        logger.info(f"  Facilities: {counts.facilities:,} ({counts.facility_percentage:.1f}%)")
-        logger.info(f"  Ancillary: {counts.ancillary:,} ({counts.ancillary_percentage:.1f}%)")
-        logger.info(f"  Uncategorized: {counts.uncategorized:,} ({counts.uncategorized_percentage:.1f}%)")
-        logger.info(f"  Total: {counts.total:,}")
-        logger.info(f"Provider type rule impact:")
-        logger.info(f"  NPIs entering rule pipeline: {counts.practitioners:,} ({counts.practitioner_percentage:.1f}%)")
-        logger.info(f"  NPIs suppressed by provider type: {counts.non_practitioner_count:,} ({counts.non_practitioner_percentage:.1f}%)")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        logger.info("\n".join([
+            "Provider type categorization complete:",
+            f"  Practitioners: {counts.practitioners:,} ({counts.practitioner_percentage:.1f}%)",
+            f"  Facilities: {counts.facilities:,} ({counts.facility_percentage:.1f}%)",
+            f"  Ancillary: {counts.ancillary:,} ({counts.ancillary_percentage:.1f}%)",
+            f"  Uncategorized: {counts.uncategorized:,} ({counts.uncategorized_percentage:.1f}%)",
+            f"  Total: {counts.total:,}",
+            "Provider type rule impact:",
+            f"  NPIs entering rule pipeline: {counts.practitioners:,} ({counts.practitioner_percentage:.1f}%)",
+            f"  NPIs suppressed by provider type: {counts.non_practitioner_count:,} ({counts.non_practitioner_percentage:.1f}%)"
+        ]))
 
 
 class UniverseValidator:
@@ -451,12 +505,12 @@ class UniverseValidator:
         Returns:
             Name of created practitioner universe table
         """
-        practitioner_npis = list(validation_results.practitioner_npis)
+        practitioner_count = len(validation_results.practitioner_npis)
         
-        if not practitioner_npis:
+        if not practitioner_count:
             raise UniverseValidationError("No practitioner NPIs found for rule processing")
         
-        logger.info(f"Creating practitioner universe table with {len(practitioner_npis):,} NPIs")
+        logger.info(f"Creating practitioner universe table with {practitioner_count:,} NPIs")
         
         # Create practitioner table
         columns = [
@@ -467,14 +521,26 @@ class UniverseValidator:
             'practitioner_universe', columns, primary_index='npi'
         )
         
-        # Insert practitioner NPIs with metadata
-        npi_data = [(npi, ProviderType.PRACTITIONER) for npi in practitioner_npis]
-        
-        logger.info(f"Inserting {len(npi_data):,} practitioner NPIs...")
-        insert_sql = f"INSERT INTO {table_name} (npi, provider_type) VALUES (?, ?)"
-        cursor = self.connection.cursor()
-        cursor.executemany(insert_sql, npi_data)
-        final_count = len(npi_data)
+        # Copy practitioner NPIs from the universe table on the server, using the
+        # same practitioner source as categorization, instead of sending them back.
+        # A user-supplied universe table may hold numeric NPIs; those go through
+        # BIGINT so they become plain digits rather than formatted numbers.
+        if validation_results.npi_is_text:
+            npi_text = "TRIM(CAST(u.npi AS VARCHAR(10)))"
+        else:
+            npi_text = "TRIM(CAST(CAST(u.npi AS BIGINT) AS VARCHAR(20)))"
+        
+        logger.info(f"Inserting {practitioner_count:,} practitioner NPIs...")
+        insert_sql = f"""
+        INSERT INTO {table_name} (npi, provider_type)
+        SELECT {npi_text}, '{ProviderType.PRACTITIONER}'
+        FROM (SELECT DISTINCT npi FROM {validation_results.universe_table_name}) u
+        INNER JOIN ({_PRACTITIONER_NPIS_SQL}) p
+            ON u.npi = p.nationalproviderid
+        """
+        cursor = self.table_manager.get_cursor()
+        cursor.execute(insert_sql)
+        final_count = inserted_row_count(cursor, table_name)
         
         logger.info(f"Practitioner universe table created: {table_name} ({final_count:,} NPIs)")
         return table_name
@@ -489,7 +555,7 @@ class UniverseValidator:
         """
         logger.info(f"Generating universe validation report: {output_path}")
         
-        with open(output_path, 'w', newline='') as f:
+        with open(output_path, 'w', newline='', buffering=REPORT_WRITE_BUFFER_BYTES) as f:
             writer = csv.writer(f)
             
             # Write header with comprehensive fields
@@ -498,31 +564,30 @@ class UniverseValidator:
                 'enters_rule_pipeline', 'suppression_reason'
             ])
             
-            # Write practitioner NPIs (enter rule pipeline)
-            for npi in validation_results.practitioner_npis:
-                writer.writerow([
-                    npi, ProviderType.PRACTITIONER, 'N', 'Y', 
+            # Each provider type shares one trailing set of columns, so every
+            # group goes to writerows as a generator and is written in C
+            row_groups = (
+                # Practitioner NPIs (enter rule pipeline)
+                (validation_results.practitioner_npis, (
+                    ProviderType.PRACTITIONER, 'N', 'Y',
                     'Practitioner type - processed by suppression rules'
-                ])
-            
-            # Write non-practitioner NPIs (suppressed by provider type rule)
-            for npi in validation_results.facility_npis:
-                writer.writerow([
-                    npi, ProviderType.FACILITY, 'Y', 'N', 
+                )),
+                # Non-practitioner NPIs (suppressed by provider type rule)
+                (validation_results.facility_npis, (
+                    ProviderType.FACILITY, 'Y', 'N',
                     'Facility type - suppressed by provider type rule'
-                ])
-            
-            for npi in validation_results.ancillary_npis:
-                writer.writerow([
-                    npi, ProviderType.ANCILLARY, 'Y', 'N', 
+                )),
+                (validation_results.ancillary_npis, (
+                    ProviderType.ANCILLARY, 'Y', 'N',
                     'Ancillary type - suppressed by provider type rule'
-                ])
-            
-            for npi in validation_results.uncategorized_npis:
-                writer.writerow([
-                    npi, ProviderType.UNCATEGORIZED, 'Y', 'N', 
+                )),
+                (validation_results.uncategorized_npis, (
+                    ProviderType.UNCATEGORIZED, 'Y', 'N',
                     'Uncategorized type - suppressed by provider type rule'
-                ])
+                )),
+            )
+            for npis, row_suffix in row_groups:
+                writer.writerows((npi,) + row_suffix for npi in npis)
         
         total_records = validation_results.total_npis
         logger.info(f"Universe validation report generated: {total_records:,} records with provider type analysis")
@@ -540,12 +605,17 @@ class UniverseValidator:
         if not self.validation_results:
             return ProviderType.UNKNOWN
         
-        return self.validation_results.npi_to_provider_type_map.get(str(npi), ProviderType.UNKNOWN)
+        return self.validation_results.provider_type_of(str(npi))
     
-    def cleanup(self) -> None:
-        """Cleans up volatile tables created during validation."""
+    def cleanup(self, drop_tables: bool = True) -> None:
+        """
+        Cleans up volatile tables created during validation.
+        
+        Args:
+            drop_tables: Drop volatile tables; False when the session is closing anyway
+        """
         logger.info("Cleaning up universe validator resources")
         
         if self.table_manager:
-            self.table_manager.cleanup_all_tables()
+            self.table_manager.cleanup_all_tables(drop_tables)
             logger.debug("Universe validator tables cleaned up")
\ No newline at end of file